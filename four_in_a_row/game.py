@@ -1,7 +1,7 @@
 # -*- coding: Utf-8 -*
 
 import random
-from typing import Iterator, Sequence
+from typing import Iterator, Sequence, Optional, Any
 import pygame
 from my_pygame import Window, Dialog, Image, ImageButton, Button, Text, RectangleShape, CircleShape
 from my_pygame import ButtonListHorizontal, ButtonListVertical, DrawableListVertical, Grid, Clickable, Cursor
@@ -37,6 +37,10 @@ class CircleBox(RectangleShape):
             self.__circle.outline_color = WHITE
         self.__circle.draw(surface)
 
+    def _draw_signature(self) -> Optional[tuple[Any, ...]]:
+        signature = super()._draw_signature()
+        return None if signature is None else (*signature, self.__circle._draw_signature())
+
     @property
     def value(self) -> int:
         return self.__value
@@ -55,16 +59,17 @@ class ColumnGrid(Clickable, DrawableListVertical):
     def __init__(self, master, width: int, height: int, column: int):
         row_height = height // NB_ROWS
         DrawableListVertical.__init__(self, offset=0)
-        self.add_multiple(CircleBox(width, row_height, row, column) for row in range(NB_ROWS))
+        self.__boxes = tuple(CircleBox(width, row_height, row, column) for row in range(NB_ROWS))
+        self.add_multiple(self.__boxes)
         Clickable.__init__(self, master, callback=lambda col=column: master.play(col), cursor=Cursor(pygame.SYSTEM_CURSOR_ARROW))
 
     @property
     def available_boxes(self) -> Iterator[CircleBox]:
-        return filter(lambda box: box.value == 0, self.drawable)
+        return filter(lambda box: box.value == 0, self.__boxes)
 
     @property
     def boxes(self) -> Sequence[CircleBox]:
-        return self.drawable
+        return self.__boxes
 
     def full(self) -> bool:
         return len(tuple(self.available_boxes)) == 0
@@ -109,6 +114,7 @@ class FourInARowGrid(ButtonListHorizontal):
         ButtonListHorizontal.__init__(self, offset=0, bg_color=BLUE, make_uniform_size=False)
         column_width = width // NB_COLUMNS
         self.add_multiple(ColumnGrid(master, column_width, height, column) for column in range(NB_COLUMNS))
+        self.set_layer_cache(True)
         self.master = master
 
     @property
@@ -119,6 +125,14 @@ class FourInARowGrid(ButtonListHorizontal):
     def map(self) -> dict[tuple[int, int], int]:
         return {(box.row, box.col): box.value for column in self.columns for box in column.boxes}
 
+    def get_box(self, row: int, column: int) -> Optional[CircleBox]:
+        if not 0 <= column < len(self.columns):
+            return None
+        boxes = self.columns[column].boxes
+        if not 0 <= row < len(boxes):
+            return None
+        return boxes[row]
+
     def _after_drawing(self, surface: pygame.Surface) -> None:
         pygame.draw.rect(surface, WHITE, self.rect, width=2)
 
@@ -132,9 +146,8 @@ class FourInARowGrid(ButtonListHorizontal):
     def play(self, player: int, column: int) -> None:
         column_object = self.columns[column]
         column_object.disable()
-        grid = self.map
         row = 0
-        while grid.get((row + 1, column), -1) == 0:
+        while getattr(self.get_box(row + 1, column), "value", -1) == 0:
             column_object.boxes[row].value = player
             self.master.draw_and_refresh()
             pygame.time.wait(35)
@@ -394,7 +407,7 @@ class FourInARowGameplay(Window):
 
     def highlight_line(self, line: list[tuple[int, int]], highlight=True):
         for row, col in line:
-            box = self.grid.columns[col].boxes[row]
+            box = self.grid.get_box(row, col)
             if highlight:
                 box.circle.color = GREEN
             else:
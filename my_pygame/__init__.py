@@ -3,17 +3,19 @@
 from .window import Window, MainWindow, WindowTransition
 from .drawable import Drawable, Animation
 from .focusable import Focusable
+from .focus_graph import FocusGraph
 from .clickable import Clickable
 from .theme import ThemeNamespace
 from .image import Image
 from .text import Text
-from .shape import Shape, RectangleShape, CircleShape, PolygonShape, CrossShape, HorizontalGradientShape, VerticalGradientShape, RadialGradientShape, SquaredGradientShape
+from .font_index import SystemFontIndex
+from .shape import Shape, RectangleShape, CircleShape, PolygonShape, CrossShape, HorizontalGradientShape, VerticalGradientShape, LinearGradientShape, RadialGradientShape, SquaredGradientShape
 from .button import Button, ImageButton
 from .entry import Entry
 from .progress import ProgressBar
 from .scale import Scale
 from .checkbox import CheckBox
-from .list import DrawableList, DrawableListHorizontal, DrawableListVertical, ButtonListHorizontal, ButtonListVertical
+from .list import DrawableList, DrawableGroup, DrawableListHorizontal, DrawableListVertical, ButtonListHorizontal, ButtonListVertical, ScrollingListVertical
 from .grid import Grid
 from .form import Form
 from .sprite import Sprite, SpriteDict
@@ -26,5 +28,6 @@ from .cursor import Cursor
 from .dialog import Dialog
 from .path import set_constant_file, set_constant_directory
 from .resources import Resources
+from .surface import SurfacePool
 from .thread import threaded_function
 from .multiplayer import ServerSocket, ClientSocket
@@ -11,6 +11,12 @@ from .window import Window
 from .colors import WHITE, GRAY, GRAY_LIGHT, GRAY_DARK, BLACK, BLUE, TRANSPARENT
 
 class Button(Clickable, RectangleShape, use_parent_theme=False):
+
+    __slots__ = (
+        "__fg", "__bg", "__img", "__text", "__custom_size", "__x_size", "__y_size", "__x_add_size", "__y_add_size",
+        "__justify_x", "__justify_y", "__offset", "__text_hover_offset", "__text_active_offset"
+    )
+
     def __init__(self, master: Window, text=str(), *, font=None, img=None, compound="left",
                  shadow=False, shadow_x=0, shadow_y=0, shadow_color=BLACK,
                  callback: Optional[Callable[..., Any]] = None, state="normal",
@@ -135,6 +141,10 @@ class Button(Clickable, RectangleShape, use_parent_theme=False):
             self.__text.move_ip(*self.__text_active_offset)
         self.__text.draw(surface)
 
+    def _draw_signature(self) -> Optional[tuple[Any, ...]]:
+        signature = super()._draw_signature()
+        return None if signature is None else (*signature, self.__text.image)
+
     def set_size(self, *size: Union[int, tuple[int, int]], smooth=True) -> None:
         RectangleShape.set_size(self, *size, smooth=smooth)
         self.__custom_size = self.size
@@ -41,6 +41,10 @@ class CheckBox(Clickable, RectangleShape, use_parent_theme=False):
         if callable(self.__on_changed_value):
             self.__on_changed_value(self.__value)
 
+    def _draw_signature(self) -> Optional[tuple[Any, ...]]:
+        signature = super()._draw_signature()
+        return None if signature is None else (*signature, self.__value)
+
     def _after_drawing(self, surface: pygame.Surface) -> None:
         RectangleShape._after_drawing(self, surface)
         if self.value == self.__on_value:
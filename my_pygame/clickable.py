@@ -31,9 +31,7 @@ class Clickable(Focusable):
         self.disabled_cursor = disabled_cursor
         self.callback = callback
         self.state = state
-        master.bind_multiple_event((pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.JOYBUTTONDOWN), self.__event_click_down)
-        master.bind_multiple_event((pygame.KEYUP, pygame.MOUSEBUTTONUP, pygame.JOYBUTTONUP), self.__event_click_up)
-        master.bind_mouse(self.__handle_mouse_position)
+        master.input_router.register(self)
 
     @property
     def master(self) -> Window:
@@ -88,6 +86,7 @@ class Clickable(Focusable):
         status = bool(status)
         active = self.__active
         self.__active = status
+        self.__master.input_router.set_active(self, status)
         if status is True:
             if not active:
                 self.focus_set()
@@ -102,6 +101,7 @@ class Clickable(Focusable):
         status = bool(status)
         hover = self.__hover
         self.__hover = status
+        self.__master.input_router.set_hover(self, status)
         if status is True:
             if not hover:
                 self.play_hover_sound()
@@ -160,7 +160,7 @@ class Clickable(Focusable):
                 return True
         return False
 
-    def __event_click_up(self, event: Event) -> None:
+    def _handle_click_up(self, event: Event) -> None:
         if hasattr(self, "is_shown") and getattr(self, "is_shown")() is False:
             return
         if not self.active:
@@ -173,26 +173,29 @@ class Clickable(Focusable):
             if self.__callback and self.state != Clickable.DISABLED:
                 self.__callback()
 
-    def __event_click_down(self, event: Event) -> None:
+    def _handle_click_down(self, event: Event) -> None:
         if hasattr(self, "is_shown") and getattr(self, "is_shown")() is False:
             return
         if self.__valid_click(event, down=True):
             self.active = True
             self.on_click_down(event)
-        elif event.type == pygame.MOUSEBUTTONDOWN:
-            self.focus_leave()
 
-    def __handle_mouse_position(self, mouse_pos: tuple[int, int]) -> None:
+    def _handle_mouse_position(self, mouse_pos: tuple[int, int], hover: bool) -> None:
         if not self.__enable_mouse or (hasattr(self, "is_shown") and getattr(self, "is_shown")() is False):
             return
-        if Focusable.actual_mode_is(Focusable.MODE_MOUSE):
-            if hasattr(self, "rect"):
-                self.hover = getattr(self, "rect").collidepoint(mouse_pos)
-                self.on_mouse_motion(mouse_pos)
-            else:
-                self.hover = False
-            if self.hover:
-                self.master.set_temporary_window_cursor(self.hover_cursor if self.state == Clickable.NORMAL else self.disabled_cursor)
+        self.hover = hover
+        self.on_mouse_motion(mouse_pos)
+        if self.hover:
+            self.master.set_temporary_window_cursor(self.hover_cursor if self.state == Clickable.NORMAL else self.disabled_cursor)
+
+    def _mouse_collide(self, mouse_pos: tuple[int, int]) -> bool:
+        if not self.__enable_mouse or (hasattr(self, "is_shown") and getattr(self, "is_shown")() is False):
+            return False
+        return hasattr(self, "rect") and bool(getattr(self, "rect").collidepoint(mouse_pos))
+
+    def _draw_signature(self) -> Optional[tuple[Any, ...]]:
+        signature = super()._draw_signature()
+        return None if signature is None else (*signature, self.__state, self.__hover, self.__active)
 
     def set_enabled_mouse(self, status: bool) -> None:
         self.__enable_mouse = bool(status)
@@ -4,16 +4,28 @@ from typing import Optional, Any, Union, Callable, Iterator, Sequence
 import pygame
 from pygame.sprite import Sprite
 from pygame.math import Vector2
-from .surface import create_surface
+from .surface import create_surface, count_allocation
 from .theme import ThemedObject
 from .clock import Clock
 
 class Drawable(Sprite, ThemedObject):
 
+    # pygame's Sprite still gives instances a __dict__: the slots keep the library's own state out of it
+    __slots__ = (
+        "__default_surface", "__mask", "__resized_surface", "__rotated_surface", "__surface_to_draw",
+        "__x", "__y", "__angle", "__move_dict", "__draw_sprite", "__valid_size", "__animation", "__parents",
+        "__transform_parent", "__layout_owner"
+    )
+    __draw_stats = {"drawn": 0, "culled": 0}
+
     def __init__(self, surface: Optional[pygame.Surface] = None, rotate=0, **kwargs):
         Sprite.__init__(self)
         ThemedObject.__init__(self)
+        self.__parents = list()
+        self.__transform_parent = None
+        self.__layout_owner = None
         self.__default_surface = self.__mask = None
+        self.__animation = None
         self.__resized_surface = None
         self.__rotated_surface = None
         self.__surface_to_draw = None
@@ -25,7 +37,6 @@ class Drawable(Sprite, ThemedObject):
         self.image = surface
         self.resize(**kwargs)
         self.set_rotation(rotate)
-        self.__animation = Animation(self)
 
     def __getitem__(self, name: str) -> Union[int, tuple[int, int]]:
         return getattr(self.rect, name)
@@ -57,27 +68,118 @@ class Drawable(Sprite, ThemedObject):
             surface = surface.image
         elif not isinstance(surface, pygame.Surface):
             surface = create_surface((0, 0))
-        self.__default_surface = (surface if not surface.get_locked() else surface.copy()).convert_alpha()
+        count_allocation()
+        self._use_image((surface if not surface.get_locked() else surface.copy()).convert_alpha())
+
+    def _use_image(self, surface: pygame.Surface) -> None:
+        self.__resolve_layout()
+        self.__default_surface = surface
         self.__surface_to_draw = self.__resized_surface = self.__rotated_surface = self.__default_surface
         self.__angle = 0
+        self._notify_parents()
 
     def get_rect(self, **kwargs) -> pygame.Rect:
         return self.image.get_rect(**kwargs)
 
+    def _add_parent(self, parent) -> None:
+        if all(obj is not parent for obj in self.__parents):
+            self.__parents.append(parent)
+            if self.__transform_parent is not None and parent is not self.__transform_parent:
+                self.__transform_parent._add_listener(parent)
+
+    def _remove_parent(self, parent) -> None:
+        if any(obj is parent for obj in self.__parents):
+            self.__parents = [obj for obj in self.__parents if obj is not parent]
+            if self.__transform_parent is not None and parent is not self.__transform_parent:
+                self.__transform_parent._remove_listener(parent)
+
+    def _notify_parents(self, content=False) -> None:
+        for parent in self.__parents:
+            parent._child_changed(content)
+
+    def _set_layout_owner(self, owner) -> None:
+        self.__layout_owner = owner
+
+    def _release_layout_owner(self, owner) -> None:
+        if self.__layout_owner is owner:
+            self.__layout_owner = None
+
+    def __resolve_layout(self) -> None:
+        if self.__layout_owner is not None:
+            self.__layout_owner._resolve_layout()
+
+    def __get_rect(self) -> pygame.Rect:
+        if self.__layout_owner is not None:
+            self.__layout_owner._resolve_layout()
+        if self.__transform_parent is None:
+            return self.image.get_rect(**self.__move_dict)
+        return self.image.get_rect(**self.__move_dict).move(self.__transform_parent.origin)
+
+    def _set_transform_parent(self, parent) -> None:
+        move_dict = self.get_move() or {"topleft": self.rect.topleft}
+        for listener in self.__parents:
+            if self.__transform_parent is not None and listener is not self.__transform_parent:
+                self.__transform_parent._remove_listener(listener)
+            if parent is not None and listener is not parent:
+                parent._add_listener(listener)
+        self.__transform_parent = parent
+        Drawable.move(self, **move_dict)
+
+    def __get_origin(self) -> tuple[int, int]:
+        if self.__transform_parent is None:
+            return (0, 0)
+        return self.__transform_parent.origin
+
+    @staticmethod
+    def __translate_move(move_dict: dict[str, Union[int, tuple[int, int]]], dx: int, dy: int) -> dict[str, Union[int, tuple[int, int]]]:
+        translated = dict()
+        for attr, value in move_dict.items():
+            if attr in ("x", "left", "right", "centerx"):
+                value += dx
+            elif attr in ("y", "top", "bottom", "centery"):
+                value += dy
+            else:
+                value = (value[0] + dx, value[1] + dy)
+            translated[attr] = value
+        return translated
+
     @property
     def mask(self) -> pygame.mask.Mask:
         return pygame.mask.from_surface(self.image)
 
     def draw(self, surface: pygame.Surface) -> None:
         if self.is_shown():
+            rect = self.rect
+            area = self._draw_area(rect)
+            if area is not None and area.w and area.h and not surface.get_clip().colliderect(area):
+                Drawable.__draw_stats["culled"] += 1
+                return
+            Drawable.__draw_stats["drawn"] += 1
             self._before_drawing(surface)
             try:
-                surface.blit(self.image, self.rect)
+                surface.blit(self.image, rect if area is not None else self.rect)
             except pygame.error:
                 pass
             self._after_drawing(surface)
             self._focus_drawing(surface)
 
+    def _draw_area(self, rect: pygame.Rect) -> Optional[pygame.Rect]:
+        return rect
+
+    def _draw_signature(self) -> Optional[tuple[Any, ...]]:
+        rect = self.rect
+        if self._draw_area(rect) is None:
+            return None
+        return (self.is_shown(), self.image, rect)
+
+    @staticmethod
+    def get_draw_stats() -> dict[str, int]:
+        return Drawable.__draw_stats.copy()
+
+    @staticmethod
+    def reset_draw_stats() -> None:
+        Drawable.__draw_stats.update(drawn=0, culled=0)
+
     def _before_drawing(self, surface: pygame.Surface) -> None:
         pass
 
@@ -90,21 +192,27 @@ class Drawable(Sprite, ThemedObject):
     def move(self, **kwargs) -> None:
         if not kwargs:
             return
-        x = self.__x
-        y = self.__y
+        self.__resolve_layout()
+        origin = self.__get_origin()
+        x = self.__x + origin[0]
+        y = self.__y + origin[1]
         common = ("center", "topleft", "topright", "bottomleft", "bottomright", "midtop", "midbottom", "midleft", "midright")
         if not any(key in kwargs for key in ("x", "left", "right", "centerx", *common)):
             kwargs["x"] = x
         if not any(key in kwargs for key in ("y", "top", "bottom", "centery", *common)):
             kwargs["y"] = y
-        self.__move_dict = kwargs
-        self.__x = self.rect.x
-        self.__y = self.rect.y
+        self.__move_dict = kwargs if self.__transform_parent is None else self.__translate_move(kwargs, -origin[0], -origin[1])
+        self.__x, self.__y = self.image.get_rect(**self.__move_dict).topleft
+        self._notify_parents()
 
     def get_move(self) -> dict[str, Union[int, tuple[int, int]]]:
-        return self.__move_dict.copy()
+        self.__resolve_layout()
+        if self.__transform_parent is None:
+            return self.__move_dict.copy()
+        return self.__translate_move(self.__move_dict, *self.__get_origin())
 
     def move_ip(self, x: float, y: float) -> None:
+        self.__resolve_layout()
         self.__x += x
         self.__y += y
         if self.__move_dict:
@@ -112,40 +220,42 @@ class Drawable(Sprite, ThemedObject):
             self.__move_dict = {attr: getattr(new_rect, attr) for attr in self.__move_dict}
         else:
             self.__move_dict = {"x": self.__x, "y": self.__y}
+        self._notify_parents()
 
     def translate(self, vector: Union[Vector2, Sequence[float]]) -> None:
         self.move_ip(vector[0], vector[1])
 
     def animate_move(self, master, speed=1, milliseconds=10, at_every_frame=None, **position) -> None:
-        self.__animation.move(speed=speed, milliseconds=milliseconds, **position)
-        self.__animation.start(master, at_every_frame)
+        self.animation.move(speed=speed, milliseconds=milliseconds, **position)
+        self.animation.start(master, at_every_frame)
 
     def animate_move_in_background(self, master, speed=1, milliseconds=10, at_every_frame=None, after_animation=None, **position) -> None:
-        self.__animation.move(speed=speed, milliseconds=milliseconds, **position)
-        self.__animation.start_in_background(master, at_every_frame, after_animation)
+        self.animation.move(speed=speed, milliseconds=milliseconds, **position)
+        self.animation.start_in_background(master, at_every_frame, after_animation)
 
     def rotate(self, angle: float, point: Optional[Union[tuple[int, int], Vector2, str]] = None) -> None:
         self.set_rotation(self.__angle + angle, point)
 
     def set_rotation(self, angle: float, point: Optional[Union[tuple[int, int], Vector2, str]] = None) -> None:
+        self.__resolve_layout()
         self.__angle = angle % 360
-        rect = self.rect
         self.__rotated_surface = pygame.transform.rotate(self.__default_surface, self.__angle)
         self.__surface_to_draw = pygame.transform.rotate(self.__resized_surface, self.__angle)
+        self._notify_parents()
         if point is not None:
-            rect = self.__resized_surface.get_rect(**self.__move_dict)
+            rect = self.__resized_surface.get_rect(**self.__move_dict).move(self.__get_origin())
             if isinstance(point, str):
                 point = getattr(rect, point)
             offset = Vector2(rect.center) - Vector2(point)
             self.move(center=self.__surface_to_draw.get_rect(center=point + offset.rotate(-angle)).center)
 
     def animate_rotate(self, master, angle: float, offset=1, point=None, milliseconds=10, at_every_frame=None) -> None:
-        self.__animation.rotate(angle=angle, offset=offset, point=point, milliseconds=milliseconds)
-        self.__animation.start(master, at_every_frame)
+        self.animation.rotate(angle=angle, offset=offset, point=point, milliseconds=milliseconds)
+        self.animation.start(master, at_every_frame)
 
     def animate_rotate_in_background(self, master, angle: float, offset=1, point=None, milliseconds=10, at_every_frame=None, after_animation=None) -> None:
-        self.__animation.rotate(angle=angle, offset=offset, point=point, milliseconds=milliseconds)
-        self.__animation.start_in_background(master, at_every_frame, after_animation)
+        self.animation.rotate(angle=angle, offset=offset, point=point, milliseconds=milliseconds)
+        self.animation.start_in_background(master, at_every_frame, after_animation)
 
     def resize(self, *, size: Optional[Union[int, tuple[int, int]]] = None,
                width: Optional[int] = None, height: Optional[int] = None,
@@ -154,6 +264,7 @@ class Drawable(Sprite, ThemedObject):
                smooth=True) -> None:
         if all(param is None for param in [size, width, height, min_width, min_height, max_width, max_height]):
             return
+        self.__resolve_layout()
         resize_func = lambda surface: self.__surface_resize(
             surface, smooth=smooth,
             size=size, width=width, height=height,
@@ -170,6 +281,7 @@ class Drawable(Sprite, ThemedObject):
             self.__valid_size = False
         else:
             self.__valid_size = True
+        self._notify_parents()
 
     @staticmethod
     def __surface_resize(surface: pygame.Surface, *, size: Optional[Union[int, tuple[int, int]]] = None,
@@ -227,29 +339,35 @@ class Drawable(Sprite, ThemedObject):
         self.resize(height=height, smooth=smooth)
 
     def animate_scale_width(self, master, width: int, offset=1, milliseconds=10, at_every_frame=None) -> None:
-        self.__animation.scale_width(width=width, offset=offset, milliseconds=milliseconds)
-        self.__animation.start(master, at_every_frame)
+        self.animation.scale_width(width=width, offset=offset, milliseconds=milliseconds)
+        self.animation.start(master, at_every_frame)
 
     def animate_scale_width_in_background(self, master, width: int, offset=1, milliseconds=10, at_every_frame=None, after_animation=None) -> None:
-        self.__animation.scale_width(width=width, offset=offset, milliseconds=milliseconds)
-        self.__animation.start_in_background(master, at_every_frame, after_animation)
+        self.animation.scale_width(width=width, offset=offset, milliseconds=milliseconds)
+        self.animation.start_in_background(master, at_every_frame, after_animation)
 
     def animate_scale_height(self, master, height: int, offset=1, milliseconds=10, at_every_frame=None) -> None:
-        self.__animation.scale_height(height=height, offset=offset, milliseconds=milliseconds)
-        self.__animation.start(master, at_every_frame)
+        self.animation.scale_height(height=height, offset=offset, milliseconds=milliseconds)
+        self.animation.start(master, at_every_frame)
 
     def animate_scale_height_in_background(self, master, height: int, offset=1, milliseconds=10, at_every_frame=None, after_animation=None) -> None:
-        self.__animation.scale_height(height=height, offset=offset, milliseconds=milliseconds)
-        self.__animation.start_in_background(master, at_every_frame, after_animation)
+        self.animation.scale_height(height=height, offset=offset, milliseconds=milliseconds)
+        self.animation.start_in_background(master, at_every_frame, after_animation)
 
     def animate_stop(self) -> None:
-        self.animation.stop()
+        if self.__animation is not None:
+            self.__animation.stop()
 
     def animate_restart(self) -> None:
         self.animation.restart()
 
-    animation = property(lambda self: self.__animation)
-    rect = property(lambda self: self.image.get_rect(**self.__move_dict))
+    @property
+    def animation(self) -> "Animation":
+        if self.__animation is None:
+            self.__animation = Animation(self)
+        return self.__animation
+
+    rect = property(lambda self: self.__get_rect())
     left = property(lambda self: self.rect.left, lambda self, value: self.move(left=value))
     right = property(lambda self: self.rect.right, lambda self, value: self.move(right=value))
     top = property(lambda self: self.rect.top, lambda self, value: self.move(top=value))
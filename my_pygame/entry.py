@@ -1,5 +1,6 @@
 # -*- coding: Utf-8 -*
 
+from typing import Optional, Any
 import pygame
 from .text import Text
 from .shape import RectangleShape
@@ -45,6 +46,12 @@ class Entry(Clickable, RectangleShape):
     def __edit(self) -> bool:
         return self.master.text_input_enabled() and self.has_focus()
 
+    def _draw_signature(self) -> Optional[tuple[Any, ...]]:
+        if self.__edit():
+            return None
+        signature = super()._draw_signature()
+        return None if signature is None else (*signature, self.__text.image)
+
     def _after_drawing(self, surface: pygame.Surface) -> None:
         RectangleShape._after_drawing(self, surface)
         self.__text.move(left=self.left + 10, centery=self.centery)
@@ -0,0 +1,159 @@
+# -*- coding: Utf-8 -*
+
+from typing import Optional, Sequence, Iterator
+from .focusable import Focusable
+
+class _FocusNode:
+
+    __slots__ = ("graph", "obj")
+
+    def __init__(self, graph, obj: Focusable):
+        self.graph = graph
+        self.obj = obj
+
+    def _child_changed(self, content=False) -> None:
+        self.graph.invalidate(self.obj)
+
+    def _get_transform_listener(self):
+        return self.graph
+
+class FocusGraph:
+
+    __BUCKET_SIZE = 64
+    __DIRECTIONS = {
+        Focusable.ON_LEFT: (-1, 0),
+        Focusable.ON_RIGHT: (1, 0),
+        Focusable.ON_TOP: (0, -1),
+        Focusable.ON_BOTTOM: (0, 1),
+    }
+
+    def __init__(self):
+        self.__objects = tuple()
+        self.__nodes = dict()
+        self.__centers = dict()
+        self.__buckets = dict()
+        self.__bounds = None
+        self.__dirty = set()
+        self.__volatile = set()
+        self.__group_moved = False
+
+    def __len__(self) -> int:
+        return len(self.__nodes)
+
+    def sync(self, objects: Sequence[Focusable]) -> None:
+        if objects is self.__objects:
+            return
+        self.__objects = objects
+        objects = set(objects)
+        for obj in [obj for obj in self.__nodes if obj not in objects]:
+            self.__detach(obj)
+        for obj in objects:
+            if obj not in self.__nodes:
+                self.__attach(obj)
+
+    def clear(self) -> None:
+        for obj in list(self.__nodes):
+            self.__detach(obj)
+        self.__objects = tuple()
+        self.__bounds = None
+
+    def invalidate(self, obj: Focusable) -> None:
+        if obj in self.__nodes:
+            self.__dirty.add(obj)
+
+    def _child_changed(self, content=False) -> None:
+        # a DrawableGroup holding some of the objects moved: one notification for the whole graph
+        self.__group_moved = True
+
+    def find(self, obj: Focusable, side: str) -> Optional[Focusable]:
+        direction = self.__DIRECTIONS.get(side)
+        if direction is None or not self.__nodes:
+            return None
+        self.__update()
+        center = self.__centers.get(obj)
+        if center is None:
+            rect = getattr(obj, "rect", None)
+            if rect is None:
+                return None
+            center = rect.center
+        size = self.__BUCKET_SIZE
+        bucket_x, bucket_y = center[0] // size, center[1] // size
+        min_x, min_y, max_x, max_y = self.__bounds
+        max_ring = max(abs(bucket_x - min_x), abs(bucket_x - max_x), abs(bucket_y - min_y), abs(bucket_y - max_y))
+        dx, dy = direction
+        best = None
+        best_score = None
+        for ring in range(max_ring + 1):
+            if best is not None and best_score[0] <= (ring - 1) * size:
+                break
+            for key in self.__ring(bucket_x, bucket_y, ring):
+                if (key[0] - bucket_x) * dx + (key[1] - bucket_y) * dy < 0:
+                    continue
+                for candidate in self.__buckets.get(key, tuple()):
+                    if candidate is obj:
+                        continue
+                    x, y = self.__centers[candidate]
+                    primary = (x - center[0]) * dx + (y - center[1]) * dy
+                    if primary <= 0:
+                        continue
+                    score = (primary + 2 * (abs(x - center[0]) * abs(dy) + abs(y - center[1]) * abs(dx)), primary)
+                    if (best_score is None or score < best_score) and candidate.take_focus():
+                        best = candidate
+                        best_score = score
+        return best
+
+    @staticmethod
+    def __ring(x: int, y: int, ring: int) -> Iterator[tuple[int, int]]:
+        if ring == 0:
+            yield (x, y)
+            return
+        for i in range(-ring, ring + 1):
+            yield (x + i, y - ring)
+            yield (x + i, y + ring)
+        for i in range(-ring + 1, ring):
+            yield (x - ring, y + i)
+            yield (x + ring, y + i)
+
+    def __attach(self, obj: Focusable) -> None:
+        node = self.__nodes[obj] = _FocusNode(self, obj)
+        if hasattr(obj, "_add_parent"):
+            obj._add_parent(node)
+        else:
+            self.__volatile.add(obj)
+        self.__dirty.add(obj)
+
+    def __detach(self, obj: Focusable) -> None:
+        node = self.__nodes.pop(obj)
+        if hasattr(obj, "_remove_parent"):
+            obj._remove_parent(node)
+        self.__remove_from_bucket(obj)
+        self.__dirty.discard(obj)
+        self.__volatile.discard(obj)
+
+    def __remove_from_bucket(self, obj: Focusable) -> None:
+        center = self.__centers.pop(obj, None)
+        if center is None:
+            return
+        key = (center[0] // self.__BUCKET_SIZE, center[1] // self.__BUCKET_SIZE)
+        bucket = self.__buckets[key]
+        bucket.remove(obj)
+        if not bucket:
+            self.__buckets.pop(key)
+
+    def __update(self) -> None:
+        if self.__group_moved:
+            self.__group_moved = False
+            self.__dirty.update(self.__nodes)
+        if not self.__dirty and not self.__volatile:
+            return
+        for obj in self.__dirty | self.__volatile:
+            self.__remove_from_bucket(obj)
+            center = self.__centers[obj] = obj.rect.center
+            key = (center[0] // self.__BUCKET_SIZE, center[1] // self.__BUCKET_SIZE)
+            self.__buckets.setdefault(key, list()).append(obj)
+            if self.__bounds is None:
+                self.__bounds = (*key, *key)
+            else:
+                min_x, min_y, max_x, max_y = self.__bounds
+                self.__bounds = (min(min_x, key[0]), min(min_y, key[1]), max(max_x, key[0]), max(max_y, key[1]))
+        self.__dirty.clear()
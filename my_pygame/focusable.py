@@ -1,6 +1,6 @@
 # -*- coding: Utf-8 -*
 
-from typing import Optional
+from typing import Optional, Any
 import pygame
 from .theme import ThemedObject
 from .colors import BLUE
@@ -73,6 +73,10 @@ class Focusable(ThemedObject):
             if outline > 0:
                 getattr(self, "focus_drawing_function", self.__default_focus_drawing_func)(surface, self.__highlight_color, outline)
 
+    def _draw_signature(self) -> Optional[tuple[Any, ...]]:
+        signature = super()._draw_signature()
+        return None if signature is None else (*signature, self.has_focus())
+
     def __default_focus_drawing_func(self, surface: pygame.Surface, highlight_color: pygame.Color, highlight_thickness: int) -> None:
         pygame.draw.rect(surface, highlight_color, getattr(self, "rect"), width=highlight_thickness)
 
@@ -0,0 +1,100 @@
+# -*- coding: Utf-8 -*
+
+import os
+import sys
+import pickle
+from typing import Optional
+import pygame
+
+class SystemFontIndex:
+
+    __index = None
+    __save_file = os.path.join(sys.path[0], "fonts.bin")
+
+    @staticmethod
+    def set_save_file(filepath: str) -> None:
+        SystemFontIndex.__save_file = filepath
+        SystemFontIndex.__index = None
+
+    @staticmethod
+    def find(name: str, bold=False, italic=False) -> tuple[Optional[str], bool, bool]:
+        index = SystemFontIndex.__get_index()
+        for single_name in str(name).split(","):
+            styles = index.get(SystemFontIndex.__simple_name(single_name))
+            if not styles:
+                continue
+            plain = styles.get((False, False))
+            filepath = styles.get((bold, italic))
+            if not (filepath or plain):
+                style, filepath = next(iter(styles.items()))
+                return (filepath, bold and not style[0], italic and not style[1])
+            if not filepath:
+                return (plain, bold, italic)
+            if filepath != plain:
+                return (filepath, False, False)
+            return (filepath, bold, italic)
+        return (None, bold, italic)
+
+    @staticmethod
+    def clear() -> None:
+        SystemFontIndex.__index = None
+        if os.path.isfile(SystemFontIndex.__save_file):
+            os.remove(SystemFontIndex.__save_file)
+
+    @staticmethod
+    def __simple_name(name: str) -> str:
+        return "".join(char for char in name.lower() if char.isalnum())
+
+    @staticmethod
+    def __get_index() -> dict[str, dict[tuple[bool, bool], str]]:
+        if SystemFontIndex.__index is not None:
+            return SystemFontIndex.__index
+        fingerprint = SystemFontIndex.__fingerprint()
+        try:
+            with open(SystemFontIndex.__save_file, "rb") as save:
+                content = pickle.load(save)
+            if content["fingerprint"] == fingerprint:
+                SystemFontIndex.__index = content["index"]
+                return SystemFontIndex.__index
+        except (OSError, pickle.UnpicklingError, EOFError, KeyError, TypeError):
+            pass
+        index = SystemFontIndex.__index = SystemFontIndex.__build_index()
+        try:
+            with open(SystemFontIndex.__save_file, "wb") as save:
+                pickle.dump({"fingerprint": fingerprint, "index": index}, save)
+        except OSError:
+            pass
+        return index
+
+    @staticmethod
+    def __build_index() -> dict[str, dict[tuple[bool, bool], str]]:
+        pygame.font.get_fonts()
+        index = {name: dict(styles) for name, styles in getattr(pygame.sysfont, "Sysalias", dict()).items()}
+        index.update((name, dict(styles)) for name, styles in getattr(pygame.sysfont, "Sysfonts", dict()).items())
+        return index
+
+    @staticmethod
+    def __font_directories() -> list[str]:
+        home = os.path.expanduser("~")
+        if sys.platform.startswith("win"):
+            return [
+                os.path.join(os.environ.get("WINDIR", "C:\\Windows"), "Fonts"),
+                os.path.join(os.environ.get("LOCALAPPDATA", home), "Microsoft", "Windows", "Fonts")
+            ]
+        if sys.platform == "darwin":
+            return ["/Library/Fonts", "/System/Library/Fonts", os.path.join(home, "Library", "Fonts")]
+        return [
+            "/usr/share/fonts", "/usr/local/share/fonts",
+            os.path.join(home, ".fonts"), os.path.join(home, ".local", "share", "fonts")
+        ]
+
+    @staticmethod
+    def __fingerprint() -> tuple:
+        directories = list()
+        for font_directory in SystemFontIndex.__font_directories():
+            for root, _, _ in os.walk(font_directory):
+                try:
+                    directories.append((root, os.stat(root).st_mtime_ns))
+                except OSError:
+                    continue
+        return (pygame.version.ver, sys.platform, tuple(directories))
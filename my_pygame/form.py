@@ -19,8 +19,9 @@ class Form(Grid):
 
     def add_entry(self, name: str, label: Text, entry: Entry, padx=10, pady=10) -> None:
         row = self.last + 1
-        self.place(label, row, 0, padx=padx, pady=pady, justify=self.__label_justify)
-        self.place(entry, row, 1, padx=padx, pady=pady, justify=self.__entry_justify)
+        with self.batch():
+            self.place(label, row, 0, padx=padx, pady=pady, justify=self.__label_justify)
+            self.place(entry, row, 1, padx=padx, pady=pady, justify=self.__entry_justify)
         self.__entry[str(name)] = entry
 
     def get_entry(self, name: str) -> Entry:
@@ -13,7 +13,14 @@ __date__   = "$Date: 2007-08-09 20:33:32 +0200 (Do, 09 Aug 2007) $"
 import pygame
 import math
 
+try:
+    import numpy
+    import pygame.surfarray
+except ImportError:
+    numpy = None
+
 BLEND_MODES_AVAILABLE = (pygame.version.vernum >= (1, 8))
+NUMPY_AVAILABLE = (numpy is not None)
     
 
 class ColorInterpolator(object):
@@ -45,6 +52,18 @@ class ColorInterpolator(object):
                 self.gInterpolator.eval(x), 
                 self.bInterpolator.eval(x), 
                 self.aInterpolator.eval(x)]
+
+    def eval_array(self, x):
+        '''
+        eval_array(x) -> array
+        
+        same as eval() for every position of the array x at once, returns an
+        array of shape x.shape+(4,) (needs numpy).
+        '''
+        return numpy.stack([self.rInterpolator.eval_array(x),
+                            self.gInterpolator.eval_array(x),
+                            self.bInterpolator.eval_array(x),
+                            self.aInterpolator.eval_array(x)], axis=-1)
             
 
 
@@ -85,6 +104,92 @@ class FunctionInterpolator(object):
 ##        return int(round(min(max(self.a*self.func(self.b*(x+self.c))+self.d, 0), 255)))
         return int(min(max(self.a*self.func(self.b*(x+self.c))+self.d, 0), 255))
 
+    def eval_array(self, x):
+        '''
+        eval_array(x)->array
+        
+        return values at every position of the array x (needs numpy)
+        '''
+        values = _apply(self.func, self.b*(x+self.c))
+        return numpy.clip(self.a*values+self.d, 0, 255).astype(numpy.uint8)
+
+
+def _apply(func, *args):
+    '''
+    _apply(func, *args)->array
+    
+    evaluates func on whole arrays when it supports it (arithmetic, numpy
+    functions), else falls back to one call per element (math functions,
+    conditions...). The result has the broadcasted shape of args.
+    '''
+    shape = numpy.broadcast(*args).shape
+    try:
+        return numpy.broadcast_to(numpy.asarray(func(*args), dtype=float), shape)
+    except (TypeError, ValueError):
+        return numpy.broadcast_to(numpy.frompyfunc(func, len(args), 1)(*args).astype(float), shape)
+
+
+def _surface(size, colors, steps, background=(0, 0, 0, 0)):
+    '''
+    _surface(size, colors, steps, background)->Surface
+    
+    returns a per pixel alpha surface of the given size where the pixel (x, y)
+    has the color colors[steps[x, y]] (steps is broadcasted to size). Steps
+    out of the colors table get the background color.
+    '''
+    surf = pygame.Surface(size).convert_alpha()
+    table = numpy.vstack([numpy.clip(colors, 0, 255), background]).astype(numpy.uint32)
+    pixels = numpy.zeros(len(table), dtype=numpy.uint32)
+    for channel, shift in zip(table.T, surf.get_shifts()):
+        pixels |= channel << shift
+    pygame.surfarray.pixels2d(surf)[...] = pixels[numpy.minimum(steps, len(colors))]
+    return surf
+
+
+def _linear(distance, startcolor, endcolor):
+    '''
+    _linear(distance, startcolor, endcolor)->array
+    
+    returns the colors of a linear gradient of the given length, computed
+    like vertical() and horizontal() do.
+    '''
+    dd = 1.0/distance
+    start = numpy.array(startcolor, dtype=float)
+    slope = (numpy.array(endcolor, dtype=float)-start)*dd
+    steps = numpy.arange(distance, dtype=float)[:, None]
+    return (start + slope*steps).astype(numpy.uint8)
+
+
+def _circle_steps(size, center):
+    '''
+    _circle_steps(size, center)->array
+    
+    returns for each pixel of a surface of the given size the radius of the
+    smallest circle around center (given in pixel corners, like
+    pygame.draw.circle) covering it.
+    '''
+    x = numpy.arange(size[0], dtype=float) + 0.5 - center[0]
+    y = numpy.arange(size[1], dtype=float) + 0.5 - center[1]
+    distances = numpy.add.outer(x*x, y*y)
+    numpy.sqrt(distances, out=distances)
+    numpy.ceil(distances, out=distances)
+    return distances.astype(numpy.int32)
+
+
+def _square_steps(length, starts):
+    '''
+    _square_steps(length, starts)->array
+    
+    starts[i] is where the square of half width i+1 begins on one axis. Returns
+    for each pixel of the axis the half width of the smallest square covering
+    it, len(starts)+1 if none does.
+    '''
+    steps = numpy.full(length, len(starts)+1)
+    for half in range(len(starts), 0, -1):
+        start = starts[half-1]
+        steps[max(start, 0):max(start+2*half, 0)] = half
+    return steps
+
 
 
 ##def gradient(surface, 
@@ -219,6 +324,8 @@ def vertical(size, startcolor, endcolor):
     surface filled with the gradient (numeric is only 2-3 times faster).
     """
     height = size[1]
+    if NUMPY_AVAILABLE:
+        return _surface(size, _linear(height, startcolor, endcolor), numpy.arange(height)[None, :])
     bigSurf = pygame.Surface((1,height)).convert_alpha()
     dd = 1.0/height
     sr, sg, sb, sa = startcolor
@@ -243,6 +350,8 @@ def horizontal(size, startcolor, endcolor):
     surface filled with the gradient (numeric is only 2-3 times faster).
     """
     width = size[0]
+    if NUMPY_AVAILABLE:
+        return _surface(size, _linear(width, startcolor, endcolor), numpy.arange(width)[:, None])
     bigSurf = pygame.Surface((width, 1)).convert_alpha()
     dd = 1.0/width
     sr, sg, sb, sa = startcolor
@@ -266,6 +375,13 @@ def radial(radius, startcolor, endcolor):
     Draws a linear raidal gradient on a square sized surface and returns
     that surface.
     """
+    if NUMPY_AVAILABLE:
+        dd = -1.0/radius
+        start = numpy.array(startcolor)
+        slope = (start-numpy.array(endcolor, dtype=float))*dd
+        colors = start + (slope*numpy.arange(radius+1)[:, None]).astype(int)
+        steps = _circle_steps((2*radius, 2*radius), (radius, radius))
+        return _surface((2*radius, 2*radius), colors, steps)
     bigSurf = pygame.Surface((2*radius, 2*radius)).convert_alpha()
     bigSurf.fill((0,0,0,0))
     dd = -1.0/radius
@@ -289,6 +405,14 @@ def squared(width, startcolor, endcolor):
     Draws a linear sqared gradient on a square sized surface and returns
     that surface.
     """
+    if NUMPY_AVAILABLE:
+        dd = -1.0/(width/2)
+        count = round(width/2)
+        start = numpy.array(startcolor)
+        slope = (start-numpy.array(endcolor, dtype=float))*dd
+        colors = start + (slope*numpy.arange(count+1)[:, None]).astype(int)
+        steps = _square_steps(width, [int((width/2)-currentw) for currentw in range(1, count+1)])
+        return _surface((width, width), colors, numpy.maximum.outer(steps, steps))
     bigSurf = pygame.Surface((width, width)).convert_alpha()
     bigSurf.fill((0,0,0,0))
     dd = -1.0/(width/2)
@@ -309,6 +433,37 @@ def squared(width, startcolor, endcolor):
     return bigSurf
 
 
+def linear(size, startcolor, endcolor, angle=0, Rfunc = (lambda x:x), Gfunc = (lambda x:x), Bfunc = (lambda x:x), Afunc = (lambda x:x)):
+    """
+    Draws a linear gradient with any angle filling the entire surface.
+    Returns a surface filled with the gradient.
+    angle is in degrees counterclockwise: 0 goes from the left side to the
+    right side like horizontal(), 90 from the bottom to the top.
+    With numpy each pixel is computed directly (no rotated, blurred surface).
+    """
+    width, height = size
+    angle %= 360
+    radians = math.radians(angle)
+    dx = math.cos(radians)
+    dy = -math.sin(radians)
+    # round away the cos/sin residue so that 0, 90, 180 and 270 are exact
+    distance = max(int(math.ceil(round(abs(dx)*width + abs(dy)*height, 6))), 1)
+    color = ColorInterpolator(distance, startcolor, endcolor, Rfunc, Gfunc, Bfunc, Afunc)
+    if NUMPY_AVAILABLE:
+        x = (numpy.arange(width) + 0.5 - width/2.) * dx
+        y = (numpy.arange(height) + 0.5 - height/2.) * dy + distance/2.
+        positions = numpy.add.outer(x, y)
+        numpy.clip(positions, 0, distance-1, out=positions)
+        steps = positions.astype(numpy.int32)
+        return _surface(size, color.eval_array(numpy.arange(distance)), steps)
+    diagonal = int(math.ceil(math.hypot(width, height)))
+    strip = pygame.transform.rotate(horizontal_func((distance, diagonal), startcolor, endcolor, Rfunc, Gfunc, Bfunc, Afunc), angle)
+    bigSurf = pygame.Surface(size).convert_alpha()
+    bigSurf.fill((0,0,0,0))
+    bigSurf.blit(strip, strip.get_rect(center=bigSurf.get_rect().center))
+    return bigSurf
+
+
 def vertical_func(size, startcolor, endcolor, Rfunc = (lambda x:x), Gfunc = (lambda x:x), Bfunc = (lambda x:x), Afunc = (lambda x:1)):
     """
     Draws a vertical linear gradient filling the entire surface. Returns a
@@ -317,8 +472,10 @@ def vertical_func(size, startcolor, endcolor, Rfunc = (lambda x:x), Gfunc = (lam
     how the color changes.
     """
     height = size[1]
-    bigSurf = pygame.Surface((1,height)).convert_alpha()
     color = ColorInterpolator(height, startcolor, endcolor, Rfunc, Gfunc, Bfunc, Afunc)
+    if NUMPY_AVAILABLE:
+        return _surface(size, color.eval_array(numpy.arange(height)+0.1), numpy.arange(height)[None, :])
+    bigSurf = pygame.Surface((1,height)).convert_alpha()
     for y in range(0, height):
         bigSurf.set_at((0,y), color.eval(y+0.1))
     return pygame.transform.scale(bigSurf, size)
@@ -332,8 +489,10 @@ def horizontal_func(size, startcolor, endcolor, Rfunc = (lambda x:x), Gfunc = (l
     how the color changes.
     """
     width = size[0]
-    bigSurf = pygame.Surface((width, 1)).convert_alpha()
     color = ColorInterpolator(width, startcolor, endcolor, Rfunc, Gfunc, Bfunc, Afunc)
+    if NUMPY_AVAILABLE:
+        return _surface(size, color.eval_array(numpy.arange(width)+0.1), numpy.arange(width)[:, None])
+    bigSurf = pygame.Surface((width, 1)).convert_alpha()
     for y in range(0, width):
         bigSurf.set_at((y, 0), color.eval(y+0.1))
     return pygame.transform.scale(bigSurf, size)
@@ -343,11 +502,14 @@ def radial_func(radius, startcolor, endcolor, Rfunc = (lambda x:x), Gfunc = (lam
     Draws a linear raidal gradient on a square sized surface and returns
     that surface.
     """
-    bigSurf = pygame.Surface((2*radius, 2*radius)).convert_alpha()
     if len(colorkey)==3:
         colorkey += (0,)
-    bigSurf.fill(colorkey)
     color = ColorInterpolator(radius, startcolor, endcolor, Rfunc, Gfunc, Bfunc, Afunc)
+    if NUMPY_AVAILABLE:
+        steps = _circle_steps((2*radius, 2*radius), (radius, radius))
+        return _surface((2*radius, 2*radius), color.eval_array(numpy.arange(radius+1)), steps, colorkey)
+    bigSurf = pygame.Surface((2*radius, 2*radius)).convert_alpha()
+    bigSurf.fill(colorkey)
     draw_circle = pygame.draw.circle
     for rad in range(radius, 0, -1):
         draw_circle(bigSurf, color.eval(rad), (radius, radius), rad)
@@ -374,8 +536,13 @@ def radial_func_offset(radius, startcolor, endcolor, Rfunc = (lambda x:x), Gfunc
     color = ColorInterpolator(radius, startcolor, endcolor, Rfunc, Gfunc, Bfunc, Afunc)
     draw_circle = pygame.draw.circle
     radi = radius + int(math.hypot(offset[0], offset[1])+1)
-    for rad in range(radi, 0, -1):
-        draw_circle(bigSurf, color.eval(rad), (radius+offset[0], radius+offset[1]), rad)
+    if NUMPY_AVAILABLE:
+        steps = _circle_steps((2*radius, 2*radius), (radius+offset[0], radius+offset[1]))
+        colors = numpy.vstack([color.eval_array(numpy.arange(radi+1)), colorkey])
+        pygame.surfarray.blit_array(bigSurf, colors[numpy.minimum(steps, radi+1), :3])
+    else:
+        for rad in range(radi, 0, -1):
+            draw_circle(bigSurf, color.eval(rad), (radius+offset[0], radius+offset[1]), rad)
         
     bigSurf.blit(mask, (0,0))
     bigSurf.set_colorkey(colorkey)
@@ -387,11 +554,17 @@ def squared_func(width, startcolor, endcolor, Rfunc = (lambda x:x), Gfunc = (lam
     Draws a linear sqared gradient on a square sized surface and returns
     that surface.
     """
+    color = ColorInterpolator(width/2, startcolor, endcolor, Rfunc, Gfunc, Bfunc, Afunc)
+    widthh = width+2*int(max(abs(offset[0]),abs(offset[1])))
+    if NUMPY_AVAILABLE:
+        count = round(widthh/2)
+        centers = [width/2+offset[0], width/2+offset[1]]
+        centers = [int(center+math.copysign(0.5, center)) for center in centers] # same rounding as Rect.center
+        steps = [_square_steps(width, [center-currentw for currentw in range(1, count+1)]) for center in centers]
+        return _surface((width, width), color.eval_array(numpy.arange(count+1)), numpy.maximum.outer(*steps))
     bigSurf = pygame.Surface((width, width)).convert_alpha()
     bigSurf.fill((0,0,0,0))
-    color = ColorInterpolator(width/2, startcolor, endcolor, Rfunc, Gfunc, Bfunc, Afunc)
     draw_rect = pygame.draw.rect
-    widthh = width+2*int(max(abs(offset[0]),abs(offset[1])))
     for currentw in range(round(widthh/2), 0, -1):
 ##        pos = (width/2)-currentw
         rect = pygame.Rect(0, 0, 2*currentw, 2*currentw )
@@ -409,6 +582,21 @@ def draw_gradient(surface, startpoint, endpoint, startcolor, endcolor, Rfunc = (
     d = int(round(math.hypot(dx, dy)))
     angle = math.degrees( math.atan2(dy, dx) )
     
+    if NUMPY_AVAILABLE and d > 0:
+        # project each pixel of the clip area on the gradient axis instead of rotating a strip
+        rect = surface.get_clip()
+        length = math.hypot(dx, dy)
+        x = (numpy.arange(rect.left, rect.right) + 0.5 - startpoint[0]) * (dx/length)
+        y = (numpy.arange(rect.top, rect.bottom) + 0.5 - startpoint[1]) * (dy/length)
+        positions = numpy.add.outer(x, y)
+        steps = numpy.where((positions >= 0) & (positions < d), positions, d).astype(int)
+        color = ColorInterpolator(d, startcolor, endcolor, Rfunc, Gfunc, Bfunc, Afunc)
+        bigSurf = _surface(rect.size, color.eval_array(numpy.arange(d)), steps)
+        if BLEND_MODES_AVAILABLE:
+            return surface.blit(bigSurf, rect, None, mode)
+        else:
+            return surface.blit(bigSurf, rect)
+    
     h = int(2.*math.hypot(*surface.get_size()))
     
     bigSurf = horizontal_func((d,h), startcolor, endcolor, Rfunc, Gfunc, Bfunc, Afunc)
@@ -520,6 +708,10 @@ def genericFxyGradient(surf, clip, color1, color2, func, intx, yint, zint=None):
     if zint: # if user give us z intervall, then use it
         z1 = min(zint)
         z2 = max(zint)
+    elif NUMPY_AVAILABLE: # look for extrema of function on the whole grid at once
+        values = _apply(func, numpy.arange(w)[:, None], numpy.arange(h)[None, :])
+        z1 = min(func(x1,y1), values.min())
+        z2 = max(func(x1,y1), values.max())
     else: # look for extrema of function (not best algorithme)
         z1 = func(x1,y1)
         z2 = z1
@@ -556,6 +748,11 @@ def genericFxyGradient(surf, clip, color1, color2, func, intx, yint, zint=None):
     c = x1/b
     e = y1/d
     
+    if NUMPY_AVAILABLE:
+        val = _apply(func, b*(numpy.arange(w)[:, None]+c), d*(numpy.arange(h)[None, :]+e))
+        colors = numpy.stack([a[k]*val+f[k] for k in range(4)], axis=-1).reshape(-1, 4)
+        surf.blit(_surface((w, h), colors, numpy.arange(w*h).reshape(w, h)), clip)
+        return
     surff = pygame.surface.Surface((w,h)).convert_alpha()
     # generate values
     for i in range(h):
@@ -1,14 +1,18 @@
 # -*- coding: Utf-8 -*
 
-from typing import Union
+from typing import Union, Optional, Any, Iterator, Iterable, Sequence
+from contextlib import contextmanager
 import pygame
 from .drawable import Drawable
 from .focusable import Focusable
 from .colors import TRANSPARENT
 from .surface import create_surface
+from .layer import LayerCache
 
 class GridCell(Focusable, Drawable, draw_focus_outline=False):
 
+    __slots__ = ("__drawable", "__justify", "__padx", "__pady", "__row", "__column")
+
     def __init__(self, master, row: int, column: int):
         Drawable.__init__(self)
         Focusable.__init__(self, master, highlight_color=TRANSPARENT, highlight_thickness=0)
@@ -32,6 +36,13 @@ class GridCell(Focusable, Drawable, draw_focus_outline=False):
         if isinstance(self.__drawable, Drawable):
             self.__drawable.draw(surface)
 
+    def _draw_signature(self) -> Optional[tuple[Any, ...]]:
+        signature = super()._draw_signature()
+        if signature is None or not isinstance(self.__drawable, Drawable):
+            return signature
+        drawable_signature = self.__drawable._draw_signature()
+        return None if drawable_signature is None else (*signature, drawable_signature)
+
     def move(self, **kwargs) -> None:
         super().move(**kwargs)
         self.__update_drawable_position()
@@ -56,17 +67,21 @@ class GridCell(Focusable, Drawable, draw_focus_outline=False):
         self.__justify = justify
         self.__padx = max(int(padx), 0)
         self.__pady = max(int(pady), 0)
-        self.reset()
         self.take_focus(isinstance(drawable, Focusable))
         self.__update_drawable_position()
 
-    def reset(self) -> None:
+    def get_content_size(self) -> tuple[int, int]:
         if not isinstance(self.__drawable, Drawable):
-            self.image = create_surface((0, 0))
-        else:
-            width = self.__drawable.width + (self.__padx * 2)
-            height = self.__drawable.height + (self.__pady * 2)
-            self.image = create_surface((width, height))
+            return (0, 0)
+        return (self.__drawable.width + (self.__padx * 2), self.__drawable.height + (self.__pady * 2))
+
+    def set_cell_size(self, width: int, height: int) -> None:
+        if self.image.get_size() != (width, height):
+            self._use_image(create_surface((width, height)))
+            self.__update_drawable_position()
+
+    def reset(self) -> None:
+        self.set_cell_size(*self.get_content_size())
 
     def set_obj_on_side(self, on_top=None, on_bottom=None, on_left=None, on_right=None) -> None:
         Focusable.set_obj_on_side(self, on_top=on_top, on_bottom=on_bottom, on_left=on_left, on_right=on_right)
@@ -86,6 +101,7 @@ class GridRow:
         self.__master = master
         self.__row = row
         self.__cells = dict()
+        self.__nb_columns = 0
 
     def __repr__(self) -> str:
         return "<{} row={}>".format(self.__class__.__name__, self.__row)
@@ -102,21 +118,23 @@ class GridRow:
 
     @property
     def nb_columns(self) -> int:
-        return max(self.cells.keys(), default=0)
+        return self.__nb_columns
 
-    def add(self, obj: Union[Drawable, Focusable], column: int, padx: int, pady: int, justify: str) -> None:
+    def add(self, obj: Union[Drawable, Focusable], column: int, padx: int, pady: int, justify: str) -> GridCell:
         if column in self.cells:
             cell = self.cells[column]
         else:
             cell = self.cells[column] = GridCell(self.__master, self.__row, column)
+            self.__nb_columns = max(self.__nb_columns, column)
         cell.set_object(obj, padx, pady, justify)
+        return cell
 
-    def move(self, left: int, top: int, width_dict: dict[int, int]) -> None:
+    def move(self, left: int, top: int, width_dict: dict[int, int], from_column=0) -> None:
         for i in range(self.nb_columns + 1):
-            if i in self.cells:
+            if i >= from_column and i in self.cells:
                 cell = self.cells[i]
                 cell.move(left=left, top=top)
-            left += width_dict[i]
+            left += width_dict.get(i, 0)
 
     def draw(self, surface: pygame.Surface) -> None:
         for cell in self.cells.values():
@@ -133,19 +151,32 @@ class GridRow:
     def get_height(self) -> int:
         return max((cell.height for cell in self.cells.values()), default=0)
 
+    def get_content_width(self, index: int) -> int:
+        if index not in self.cells:
+            return 0
+        return self.cells[index].get_content_size()[0]
+
+    def get_content_height(self) -> int:
+        return max((cell.get_content_size()[1] for cell in self.cells.values()), default=0)
+
     def reset(self) -> None:
         for cell in self.cells.values():
             cell.reset()
 
     def set_cell_size(self, width_dict: dict[int, int], height_dict: dict[int, int]) -> None:
         for cell in self.cells.values():
-            cell.image = create_surface((width_dict[cell.column], height_dict[self.__row]))
+            cell.set_cell_size(width_dict[cell.column], height_dict[self.__row])
 
     def index(self) -> int:
         return self.__row
 
 class Grid(Drawable, use_parent_theme=False):
 
+    __slots__ = (
+        "__master", "__bg_color", "__rows_dict", "__max_width_columns", "__max_height_rows", "__layer_cache",
+        "__nb_rows", "__nb_columns", "__batch_depth", "__pending_cells", "__cell_index", "__cells_view", "__objects_views"
+    )
+
     def __init__(self, master, bg_color=None):
         Drawable.__init__(self)
         self.__master = master
@@ -154,6 +185,13 @@ class Grid(Drawable, use_parent_theme=False):
         self.__rows_dict = dict()
         self.__max_width_columns = dict()
         self.__max_height_rows = dict()
+        self.__layer_cache = None
+        self.__nb_rows = self.__nb_columns = 0
+        self.__batch_depth = 0
+        self.__pending_cells = set()
+        self.__cell_index = dict()
+        self.__cells_view = None
+        self.__objects_views = dict()
 
     @property
     def rows(self) -> dict[int, GridRow]:
@@ -164,7 +202,7 @@ class Grid(Drawable, use_parent_theme=False):
 
     @property
     def nb_rows(self) -> int:
-        return max(self.rows.keys(), default=0)
+        return self.__nb_rows
 
     @property
     def first(self) -> int:
@@ -180,7 +218,7 @@ class Grid(Drawable, use_parent_theme=False):
 
     @property
     def nb_columns(self) -> int:
-        return max((row.nb_columns for row in self.rows.values()), default=0)
+        return self.__nb_columns
 
     @property
     def bg_color(self) -> pygame.Color:
@@ -191,9 +229,12 @@ class Grid(Drawable, use_parent_theme=False):
         self.__bg_color = TRANSPARENT if color is None else pygame.Color(color)
         self.__update_background(self.size)
 
-    def __update_background(self, size: tuple[int, int]) -> None:
-        self.image = create_surface(size)
-        self.image.fill(self.__bg_color)
+    def __update_background(self, size: tuple[int, int], force=True) -> None:
+        if not force and self.image.get_size() == tuple(size):
+            return
+        surface = create_surface(size)
+        surface.fill(self.__bg_color)
+        self._use_image(surface)
 
     def __getitem__(self, cell: tuple[int, int]) -> Union[Drawable, Focusable]:
         return self.get_obj_in_cell(*cell)
@@ -202,21 +243,37 @@ class Grid(Drawable, use_parent_theme=False):
         self.place(row=cell[0], column=cell[1], **infos)
 
     def get_obj_in_cell(self, row: int, column: int) -> Union[Drawable, Focusable]:
-        if row not in self.rows or column not in self.rows[row].cells:
+        cell = self.__cell_index.get((row, column))
+        if cell is None:
             return None
-        return self.rows[row].cells[column].get()
+        return cell.get()
+
+    def get_cell(self, row: int, column: int) -> Optional[GridCell]:
+        return self.__cell_index.get((row, column))
 
     def place(self, obj: Union[Drawable, Focusable], row: int, column: int, padx=0, pady=0, justify="center") -> None:
-        self.__add_object(obj, row, column, padx, pady, justify)
-        self.update_grid()
+        with self.batch():
+            self.__add_object(obj, row, column, padx, pady, justify)
 
     def place_multiple(self, obj_dict: dict[tuple[int, int], Union[Drawable, Focusable, dict[str, Union[int, Drawable, Focusable]]]]) -> None:
-        for (row, col), item in obj_dict.items():
-            if isinstance(item, dict):
-                self.__add_object(row=row, column=col, **item)
-            else:
-                self.__add_object(item, row, col)
-        self.update_grid()
+        with self.batch():
+            for (row, col), item in obj_dict.items():
+                if isinstance(item, dict):
+                    self.__add_object(row=row, column=col, **item)
+                else:
+                    self.__add_object(item, row, col)
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        self.__batch_depth += 1
+        try:
+            yield
+        finally:
+            self.__batch_depth -= 1
+            if self.__batch_depth == 0 and self.__pending_cells:
+                pending_cells = self.__pending_cells
+                self.__pending_cells = set()
+                self.__update_layout(pending_cells)
 
     def __add_object(self, obj: Union[Drawable, Focusable], row: int, column: int, padx=0, pady=0, justify="center") -> None:
         row = max(int(row), 0)
@@ -225,35 +282,90 @@ class Grid(Drawable, use_parent_theme=False):
             grid_row = self.rows[row]
         else:
             grid_row = self.rows[row] = GridRow(self.__master, row)
-        grid_row.add(obj, column, padx, pady, justify)
+            self.__nb_rows = max(self.__nb_rows, row)
+        self.__cell_index[(row, column)] = grid_row.add(obj, column, padx, pady, justify)
+        self.__cells_view = None
+        self.__objects_views.clear()
+        self.__nb_columns = max(self.__nb_columns, column)
+        self.__pending_cells.add((row, column))
+        self._notify_parents(content=True)
 
     def update_grid(self) -> None:
+        if self.__layer_cache is not None:
+            self.__layer_cache.clear()
         self.__max_width_columns.clear()
         self.__max_height_rows.clear()
-        if self.rows:
-            for row in self.rows.values():
-                row.reset()
-            for i in range(self.nb_columns + 1):
-                self.__max_width_columns[i] = max(row.get_cell_width(i) for row in self.rows.values())
-            for i in range(self.nb_rows + 1):
-                self.__max_height_rows[i] = 0 if i not in self.rows else self.rows[i].get_height()
-            for row in self.rows.values():
-                row.set_cell_size(self.__max_width_columns, self.__max_height_rows)
-            grid_width = max(row.get_width() for row in self.rows.values())
-            grid_height = sum(row.get_height() for row in self.rows.values())
-            self.__update_background((grid_width, grid_height))
-            self.__set_obj_on_side_intern()
+        self.__pending_cells.clear()
+        self.__update_layout({(cell.row, cell.column) for cell in self.cells})
+
+    def __update_layout(self, changed_cells: Iterable[tuple[int, int]]) -> None:
+        if not self.rows:
+            self.image = create_surface((0, 0))
+            return
+        changed_cells = set(changed_cells)
+        width_columns = self.__max_width_columns
+        height_rows = self.__max_height_rows
+        resized_columns = list()
+        resized_rows = list()
+        for column in {column for _, column in changed_cells}:
+            width = max(row.get_content_width(column) for row in self.rows.values())
+            if width_columns.get(column) != width:
+                width_columns[column] = width
+                resized_columns.append(column)
+        for row in {row for row, _ in changed_cells}:
+            height = self.rows[row].get_content_height()
+            if height_rows.get(row) != height:
+                height_rows[row] = height
+                resized_rows.append(row)
+        for column in resized_columns:
+            changed_cells.update((row.index(), column) for row in self.rows.values() if column in row.cells)
+        for row in resized_rows:
+            changed_cells.update((row, column) for column in self.rows[row].cells)
+        for row, column in changed_cells:
+            self.rows[row].cells[column].set_cell_size(width_columns[column], height_rows[row])
+        grid_width = max(sum(width_columns[column] for column in row.cells) for row in self.rows.values())
+        grid_height = sum(height_rows[row] for row in self.rows)
+        topleft = self.topleft
+        self.__update_background((grid_width, grid_height), force=False)
+        if self.topleft != topleft:
             self.__update_cell_positions()
         else:
-            self.image = create_surface((0, 0))
+            self.__update_cell_positions(
+                first_row=min(resized_rows, default=self.__nb_rows + 1),
+                first_column=min(resized_columns, default=self.__nb_columns + 1),
+                cells=changed_cells
+            )
+        if getattr(self.__master, "spatial_focus_enabled", lambda: False)():
+            return
+        for row, column in changed_cells:
+            self.__link_cell(row, column)
+            for neighbor in ((row - 1, column), (row + 1, column), (row, column - 1), (row, column + 1)):
+                if neighbor not in changed_cells:
+                    self.__link_cell(*neighbor)
 
     # def _before_drawing(self, surface: pygame.Surface) -> None:
     #     self.update_grid()
 
     def _after_drawing(self, surface: pygame.Surface) -> None:
+        if self.__layer_cache is not None:
+            self.__layer_cache.draw(surface, self.rect, self.cells)
+            return
         for row in self.rows.values():
             row.draw(surface)
 
+    def _draw_signature(self) -> Optional[tuple[Any, ...]]:
+        signature = super()._draw_signature()
+        cells_signature = tuple(cell._draw_signature() for cell in self.cells)
+        if signature is None or None in cells_signature:
+            return None
+        return (*signature, cells_signature)
+
+    def set_layer_cache(self, status: bool) -> None:
+        if not status:
+            self.__layer_cache = None
+        elif self.__layer_cache is None:
+            self.__layer_cache = LayerCache()
+
     def move(self, **kwargs) -> None:
         Drawable.move(self, **kwargs)
         self.__update_cell_positions()
@@ -262,15 +374,23 @@ class Grid(Drawable, use_parent_theme=False):
         Drawable.move_ip(self, x, y)
         self.__update_cell_positions()
 
-    def __update_cell_positions(self) -> None:
+    def __update_cell_positions(self, first_row=0, first_column=0, cells: Iterable[tuple[int, int]] = tuple()) -> None:
         if not self.rows:
             return
         top = self.top
+        rows_top = dict()
         for i in range(self.nb_rows + 1):
             if i in self.rows:
-                row = self.rows[i]
-                row.move(self.left, top, self.__max_width_columns)
-            top += self.__max_height_rows[i]
+                rows_top[i] = top
+                if i >= first_row:
+                    self.rows[i].move(self.left, top, self.__max_width_columns)
+                elif first_column <= self.rows[i].nb_columns:
+                    self.rows[i].move(self.left, top, self.__max_width_columns, from_column=first_column)
+            top += self.__max_height_rows.get(i, 0)
+        for row, column in cells:
+            if row < first_row and column < first_column:
+                left = self.left + sum(self.__max_width_columns.get(i, 0) for i in range(column))
+                self.rows[row].cells[column].move(left=left, top=rows_top[row])
 
     def set_size(self, *size: Union[int, tuple[int, int]], smooth=True) -> None:
         pass
@@ -281,19 +401,18 @@ class Grid(Drawable, use_parent_theme=False):
     def set_height(self, height: float, smooth=True) -> None:
         pass
 
-    def __set_obj_on_side_intern(self) -> None:
-        for row_index, row in self.rows.items():
-            prev_row = self.rows.get(row_index - 1)
-            next_row = self.rows.get(row_index + 1)
-            for column_index, cell in filter(lambda item: isinstance(item[1], Focusable), row.cells.items()):
-                prev_cell = row.cells.get(column_index - 1)
-                next_cell = row.cells.get(column_index + 1)
-                cell.set_obj_on_side(
-                    on_top=None if not isinstance(prev_row, GridRow) else prev_row.cells.get(column_index),
-                    on_bottom=None if not isinstance(next_row, GridRow) else next_row.cells.get(column_index),
-                    on_left=prev_cell,
-                    on_right=next_cell
-                )
+    def __link_cell(self, row_index: int, column_index: int) -> None:
+        row = self.rows.get(row_index)
+        if row is None or column_index not in row.cells:
+            return
+        prev_row = self.rows.get(row_index - 1)
+        next_row = self.rows.get(row_index + 1)
+        row.cells[column_index].set_obj_on_side(
+            on_top=None if not isinstance(prev_row, GridRow) else prev_row.cells.get(column_index),
+            on_bottom=None if not isinstance(next_row, GridRow) else next_row.cells.get(column_index),
+            on_left=row.cells.get(column_index - 1),
+            on_right=row.cells.get(column_index + 1)
+        )
 
     def set_obj_on_side(self, on_top=None, on_bottom=None, on_left=None, on_right=None) -> None:
         if isinstance(self, Focusable):
@@ -328,22 +447,21 @@ class Grid(Drawable, use_parent_theme=False):
                     cells[-1].remove_obj_on_side(Focusable.ON_RIGHT)
 
     @property
-    def focusable(self) -> list[Focusable]:
+    def focusable(self) -> Sequence[Focusable]:
         return self.find_objects(Focusable)
 
     @property
-    def drawable(self) -> list[Drawable]:
+    def drawable(self) -> Sequence[Drawable]:
         return self.find_objects(Drawable)
 
     @property
-    def cells(self) -> list[GridCell]:
-        return [cell for row in self.rows.values() for cell in row.cells.values()]
-
-    def find_objects(self, obj_type: type[object]) -> list[object]:
-        obj_list = list()
-        for row in self.rows.values():
-            for cell in row.cells.values():
-                obj = cell.get()
-                if isinstance(obj, obj_type):
-                    obj_list.append(obj)
-        return obj_list
+    def cells(self) -> Sequence[GridCell]:
+        if self.__cells_view is None:
+            self.__cells_view = tuple(cell for row in self.rows.values() for cell in row.cells.values())
+        return self.__cells_view
+
+    def find_objects(self, obj_type: type[object]) -> Sequence[object]:
+        objects = self.__objects_views.get(obj_type)
+        if objects is None:
+            objects = self.__objects_views[obj_type] = tuple(obj for obj in (cell.get() for cell in self.cells) if isinstance(obj, obj_type))
+        return objects
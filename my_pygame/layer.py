@@ -0,0 +1,80 @@
+# -*- coding: Utf-8 -*
+
+from typing import Sequence, Optional, Any
+import pygame
+from .surface import create_surface, SurfacePool
+from .colors import TRANSPARENT
+
+class LayerCache:
+
+    __slots__ = ("__surface", "__topleft", "__signatures")
+
+    MAX_DIRTY_AREAS = 8
+
+    def __init__(self):
+        self.__surface = None
+        self.__topleft = None
+        self.__signatures = dict()
+
+    def clear(self) -> None:
+        self.__surface = None
+        self.__topleft = None
+        self.__signatures.clear()
+
+    def draw(self, surface: pygame.Surface, area: pygame.Rect, objects: Sequence[Any]) -> None:
+        area = area.clip(surface.get_rect())
+        if not area.w or not area.h:
+            return
+        layer = self.__surface
+        if layer is None or layer.get_size() != area.size or self.__topleft != area.topleft:
+            layer = self.__surface = create_surface(area.size)
+            self.__topleft = area.topleft
+            self.__signatures = {obj: (obj._draw_signature(), LayerCache.__get_area(obj)) for obj in objects}
+            dirty_areas = [area]
+        else:
+            dirty_areas = self.__update_signatures(objects, area)
+        if dirty_areas:
+            LayerCache.__redraw(layer, area, dirty_areas, objects)
+        surface.blit(layer, area)
+
+    @staticmethod
+    def __redraw(layer: pygame.Surface, area: pygame.Rect, dirty_areas: list[pygame.Rect], objects: Sequence[Any]) -> None:
+        # objects draw at their screen position: render them in a pooled buffer, then copy the dirty areas
+        buffer = SurfacePool.acquire((area.right, area.bottom))
+        for dirty_area in dirty_areas:
+            buffer.set_clip(dirty_area)
+            buffer.fill(TRANSPARENT, dirty_area)
+            for obj in objects:
+                obj.draw(buffer)
+            layer_area = dirty_area.move(-area.x, -area.y)
+            layer.fill(TRANSPARENT, layer_area)
+            layer.blit(buffer, layer_area, dirty_area, special_flags=pygame.BLEND_RGBA_MAX)
+        SurfacePool.release(buffer)
+
+    def __update_signatures(self, objects: Sequence[Any], layer_rect: pygame.Rect) -> list[pygame.Rect]:
+        dirty_areas = list()
+        former_signatures = self.__signatures
+        signatures = self.__signatures = dict()
+        for obj in objects:
+            signature = obj._draw_signature()
+            former = former_signatures.pop(obj, None)
+            if signature is not None and former is not None and former[0] == signature:
+                signatures[obj] = former
+                continue
+            obj_area = LayerCache.__get_area(obj)
+            signatures[obj] = (signature, obj_area)
+            if former is not None and former[1] != obj_area:
+                dirty_areas.append(former[1])
+            dirty_areas.append(obj_area)
+        dirty_areas.extend(obj_area for _, obj_area in former_signatures.values())
+        if any(obj_area is None for obj_area in dirty_areas):
+            return [layer_rect]
+        dirty_areas = [obj_area.clip(layer_rect) for obj_area in dirty_areas]
+        dirty_areas = [obj_area for obj_area in dirty_areas if obj_area.w and obj_area.h]
+        if len(dirty_areas) > LayerCache.MAX_DIRTY_AREAS:
+            return [dirty_areas[0].unionall(dirty_areas[1:])]
+        return dirty_areas
+
+    @staticmethod
+    def __get_area(obj: Any) -> Optional[pygame.Rect]:
+        return obj._draw_area(obj.rect)
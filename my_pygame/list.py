@@ -1,29 +1,43 @@
 # -*- coding: Utf-8 -*
 
-from typing import Sequence, Iterable, Iterator, Any, Union
+from bisect import bisect_left
+from typing import Sequence, Iterable, Iterator, Optional, Any, Union, Callable
 import pygame
 from .drawable import Drawable
 from .focusable import Focusable
 from .grid import Grid
+from .layer import LayerCache
 from .colors import TRANSPARENT
 
 class DrawableList:
     def __init__(self, bg_color=None, draw=True):
         self.__bg_color = pygame.Color(bg_color) if bg_color is not None else TRANSPARENT
+        self.__objects = dict()
         self.__list = list()
+        self.__z_order = list()
+        self.__next_z = 0
+        self.__compact_needed = False
         self.__draw = draw
+        self.__layer_cache = None
+        self.__parents = list()
+        self.__rect = None
+        self.__objects_views = dict()
+        self.__layout_owner = None
 
     def __len__(self) -> int:
-        return len(self.__list)
+        return len(self.__objects)
 
     def __iter__(self) -> Iterator[Drawable]:
-        return iter(self.__list)
+        return iter(self.list)
 
     def __getitem__(self, index: int) -> Drawable:
-        return self.__list[index]
+        return self.list[index]
 
     def __contains__(self, value: Any) -> bool:
-        return bool(value in self.__list)
+        try:
+            return bool(value in self.__objects)
+        except TypeError:
+            return False
 
     @staticmethod
     def get_valid_classes() -> tuple[type]:
@@ -31,17 +45,73 @@ class DrawableList:
 
     @property
     def rect(self) -> pygame.Rect:
-        left = min((obj.left for obj in self.__list), default=0)
-        right = max((obj.right for obj in self.__list), default=0)
-        top = min((obj.top for obj in self.__list), default=0)
-        bottom = max((obj.bottom for obj in self.__list), default=0)
+        self._resolve_layout()
+        if self.__rect is None:
+            self.__rect = self._compute_rect()
+        return self.__rect.copy()
+
+    def _compute_rect(self) -> pygame.Rect:
+        rects = [obj.rect for obj in self.list]
+        left = min((rect.left for rect in rects), default=0)
+        right = max((rect.right for rect in rects), default=0)
+        top = min((rect.top for rect in rects), default=0)
+        bottom = max((rect.bottom for rect in rects), default=0)
         width = right - left
         height = bottom - top
         return pygame.Rect(left, top, width, height)
 
+    def _add_parent(self, parent) -> None:
+        if all(obj is not parent for obj in self.__parents):
+            self.__parents.append(parent)
+
+    def _remove_parent(self, parent) -> None:
+        self.__parents = [obj for obj in self.__parents if obj is not parent]
+
+    def _get_parents(self) -> tuple[Any, ...]:
+        return tuple(self.__parents)
+
+    def _notify_parents(self, content=False) -> None:
+        for parent in self.__parents:
+            parent._child_changed(content)
+
+    def _scroll_focus(self, obj: Focusable, side: str) -> bool:
+        return False
+
+    def _scroll_wheel(self, mouse_pos: tuple[int, int], wheel: int) -> bool:
+        return False
+
+    def _set_layout_owner(self, owner) -> None:
+        self.__layout_owner = owner
+        if self._get_children_layout_owner() is owner:
+            for obj in self.list:
+                obj._set_layout_owner(owner)
+
+    def _release_layout_owner(self, owner) -> None:
+        if self.__layout_owner is owner:
+            release_children = self._get_children_layout_owner() is owner
+            self.__layout_owner = None
+            if release_children:
+                for obj in self.list:
+                    obj._release_layout_owner(owner)
+
+    def _get_children_layout_owner(self):
+        return self.__layout_owner
+
+    def _resolve_layout(self) -> None:
+        if self.__layout_owner is not None:
+            self.__layout_owner._resolve_layout()
+
+    def _child_changed(self, content=False) -> None:
+        if self.__rect is None and not (content and self.__objects_views):
+            return
+        self.__rect = None
+        if content:
+            self.__objects_views.clear()
+        self._notify_parents(content)
+
     @property
     def end(self) -> int:
-        return len(self.__list)
+        return len(self.__objects)
 
     @property
     def bg_color(self) -> pygame.Color:
@@ -51,43 +121,122 @@ class DrawableList:
         self.add_multiple([obj, *objs])
 
     def add_multiple(self, iterable_of_objects: Iterable[Drawable]) -> None:
+        layout_owner = self._get_children_layout_owner()
         for obj in iterable_of_objects:
-            if isinstance(obj, self.get_valid_classes()) and obj not in self.__list:
+            if isinstance(obj, self.get_valid_classes()) and obj not in self.__objects:
+                self.__objects[obj] = self.__next_z
                 self.__list.append(obj)
+                self.__z_order.append(self.__next_z)
+                self.__next_z += 1
+                obj._add_parent(self)
+                if layout_owner is not None:
+                    obj._set_layout_owner(layout_owner)
+        self._child_changed(content=True)
 
     def remove(self, *obj_list: Drawable) -> None:
+        layout_owner = self._get_children_layout_owner()
         for obj in obj_list:
-            if obj in self.__list:
-                self.__list.remove(obj)
+            if obj in self:
+                self.__objects.pop(obj)
+                self.__compact_needed = True
+                obj._remove_parent(self)
+                if layout_owner is not None:
+                    obj._release_layout_owner(layout_owner)
+        self._child_changed(content=True)
 
     def remove_from_index(self, index: int) -> None:
-        if index in range(len(self.__list)):
-            self.__list.pop(index)
+        if index in range(len(self)):
+            DrawableList.remove(self, self.list[index])
 
     def clear(self) -> None:
+        layout_owner = self._get_children_layout_owner()
+        for obj in self.__objects:
+            obj._remove_parent(self)
+            if layout_owner is not None:
+                obj._release_layout_owner(layout_owner)
+        self.__objects.clear()
         self.__list.clear()
+        self.__z_order.clear()
+        self.__next_z = 0
+        self.__compact_needed = False
+        self._child_changed(content=True)
 
     def empty(self) -> bool:
-        return bool(self.__list)
+        return bool(self.__objects)
 
     def set_priority(self, obj: Drawable, new_pos: int, relative_to=None) -> None:
-        former_pos = self.__list.index(obj)
-        self.__list.pop(former_pos)
+        if obj not in self:
+            raise ValueError("{} is not in list".format(obj))
+        objects = self.list
+        z_order = self.__z_order
+        former_pos = bisect_left(z_order, self.__objects[obj])
+        objects.pop(former_pos)
+        z_order.pop(former_pos)
         if relative_to:
-            new_pos += self.__list.index(relative_to)
-        self.__list.insert(new_pos, obj)
+            if relative_to in self and relative_to is not obj:
+                new_pos += bisect_left(z_order, self.__objects[relative_to])
+            else:
+                new_pos += objects.index(relative_to)
+        if new_pos < 0:
+            new_pos = max(new_pos + len(objects), 0)
+        new_pos = min(new_pos, len(objects))
+        before = z_order[new_pos - 1] if new_pos > 0 else z_order[0] - 2 if z_order else 0
+        after = z_order[new_pos] if new_pos < len(z_order) else before + 2
+        z = (before + after) / 2
+        objects.insert(new_pos, obj)
+        z_order.insert(new_pos, z)
+        self.__objects[obj] = z
+        if z >= self.__next_z:
+            self.__next_z = int(z) + 1
+        if not before < z < after:
+            self.__renumber()
+        self._child_changed(content=True)
+
+    def __compact(self) -> None:
+        objects = self.__objects
+        ordered = [(obj, z) for obj, z in zip(self.__list, self.__z_order) if objects.get(obj) == z]
+        self.__list[:] = [obj for obj, _ in ordered]
+        self.__z_order[:] = [z for _, z in ordered]
+        self.__compact_needed = False
+
+    def __renumber(self) -> None:
+        self.__z_order[:] = range(len(self.__list))
+        self.__objects.update(zip(self.__list, self.__z_order))
+        self.__next_z = len(self.__list)
 
     def draw(self, surface: pygame.Surface) -> None:
         if self.is_shown() and self.__draw:
             self._before_drawing(surface)
             if self.__bg_color and self.__bg_color != TRANSPARENT:
                 pygame.draw.rect(surface, self.__bg_color, self.rect)
-            for obj in self.__list:
+            if self.__layer_cache is not None:
+                for obj in self.list:
+                    if isinstance(obj, Focusable):
+                        obj.focus_update()
+                self.__layer_cache.draw(surface, self.rect, self.list)
+                self._after_drawing(surface)
+                return
+            for obj in self.list:
                 if isinstance(obj, Focusable):
                     obj.focus_update()
                 obj.draw(surface)
             self._after_drawing(surface)
 
+    def _draw_area(self, rect: pygame.Rect) -> Optional[pygame.Rect]:
+        return rect
+
+    def _draw_signature(self) -> Optional[tuple[Any, ...]]:
+        signature = tuple(obj._draw_signature() for obj in self.list)
+        if None in signature:
+            return None
+        return (self.is_shown(), self.__bg_color, signature)
+
+    def set_layer_cache(self, status: bool) -> None:
+        if not status:
+            self.__layer_cache = None
+        elif self.__layer_cache is None:
+            self.__layer_cache = LayerCache()
+
     def _before_drawing(self, surface: pygame.Surface) -> None:
         pass
 
@@ -95,33 +244,36 @@ class DrawableList:
         pass
 
     def update(self, *args, **kwargs) -> None:
-        for obj in self.__list:
+        for obj in self.list:
             obj.update(*args, **kwargs)
 
     def move(self, **kwargs) -> None:
         pass
 
     def move_ip(self, x: float, y: float) -> None:
-        for obj in self.__list:
+        self._resolve_layout()
+        for obj in self.list:
             obj.move_ip(x, y)
 
     def show(self) -> None:
-        for obj in self.__list:
+        for obj in self.list:
             obj.show()
 
     def hide(self) -> None:
-        for obj in self.__list:
+        for obj in self.list:
             obj.hide()
 
     def set_visibility(self, status: bool) -> None:
-        for obj in self.__list:
+        for obj in self.list:
             obj.set_visibility(status)
 
     def is_shown(self) -> bool:
-        return any(obj.is_shown() for obj in self.__list)
+        return any(obj.is_shown() for obj in self.list)
 
     @property
     def list(self) -> Sequence[Drawable]:
+        if self.__compact_needed:
+            self.__compact()
         return self.__list
 
     @property
@@ -133,13 +285,16 @@ class DrawableList:
         return self.find_objects(Drawable)
 
     def find_objects(self, obj_type: type[object]) -> Sequence[object]:
-        obj_list = list()
-        for obj in self.__list:
-            if isinstance(obj, obj_type):
-                obj_list.append(obj)
-            if isinstance(obj, (DrawableList, Grid)):
-                obj_list.extend(obj.find_objects(obj_type))
-        return obj_list
+        objects = self.__objects_views.get(obj_type)
+        if objects is None:
+            obj_list = list()
+            for obj in self.list:
+                if isinstance(obj, obj_type):
+                    obj_list.append(obj)
+                if isinstance(obj, (DrawableList, Grid)):
+                    obj_list.extend(obj.find_objects(obj_type))
+            objects = self.__objects_views[obj_type] = tuple(obj_list)
+        return objects
 
     left = property(lambda self: self.rect.left, lambda self, value: self.move(left=value))
     right = property(lambda self: self.rect.right, lambda self, value: self.move(right=value))
@@ -164,6 +319,113 @@ class DrawableList:
     midleft = property(lambda self: self.rect.midleft, lambda self, value: self.move(midleft=value))
     midright = property(lambda self: self.rect.midright, lambda self, value: self.move(midright=value))
 
+class DrawableGroup(DrawableList):
+    def __init__(self, bg_color=None, draw=True):
+        DrawableList.__init__(self, bg_color=bg_color, draw=draw)
+        self.__position = (0, 0)
+        self.__transform_parent = None
+        self.__listeners = dict()
+
+    @staticmethod
+    def get_valid_classes() -> tuple[type]:
+        return (Drawable, DrawableGroup)
+
+    @property
+    def origin(self) -> tuple[int, int]:
+        if self.__transform_parent is None:
+            return self.__position
+        parent_x, parent_y = self.__transform_parent.origin
+        return (self.__position[0] + parent_x, self.__position[1] + parent_y)
+
+    def _set_transform_parent(self, parent) -> None:
+        x, y = self.origin
+        listeners = [obj for obj in self._get_parents() if obj is not self.__transform_parent and obj is not parent]
+        if self.__transform_parent is not None:
+            for listener in [*listeners, *self.__listeners]:
+                self.__transform_parent._remove_listener(listener)
+        if parent is not None:
+            for listener in [*listeners, *self.__listeners]:
+                parent._add_listener(listener)
+        self.__transform_parent = parent
+        parent_x, parent_y = parent.origin if parent is not None else (0, 0)
+        self.__position = (x - parent_x, y - parent_y)
+
+    def _add_parent(self, parent) -> None:
+        if self.__transform_parent is not None and parent is not self.__transform_parent \
+        and all(obj is not parent for obj in self._get_parents()):
+            self.__transform_parent._add_listener(parent)
+        DrawableList._add_parent(self, parent)
+
+    def _remove_parent(self, parent) -> None:
+        if self.__transform_parent is not None and parent is not self.__transform_parent \
+        and any(obj is parent for obj in self._get_parents()):
+            self.__transform_parent._remove_listener(parent)
+        DrawableList._remove_parent(self, parent)
+
+    def _add_listener(self, parent) -> None:
+        # parents of descendants other than this group (other lists, focus graphs) follow its moves from here
+        listener = getattr(parent, "_get_transform_listener", lambda: parent)()
+        count = self.__listeners.get(listener, 0)
+        self.__listeners[listener] = count + 1
+        if not count and self.__transform_parent is not None:
+            self.__transform_parent._add_listener(listener)
+
+    def _remove_listener(self, parent) -> None:
+        listener = getattr(parent, "_get_transform_listener", lambda: parent)()
+        count = self.__listeners.get(listener, 0)
+        if count > 1:
+            self.__listeners[listener] = count - 1
+        elif count:
+            self.__listeners.pop(listener)
+            if self.__transform_parent is not None:
+                self.__transform_parent._remove_listener(listener)
+
+    @property
+    def rect(self) -> pygame.Rect:
+        return DrawableList.rect.fget(self).move(self.origin)
+
+    def _compute_rect(self) -> pygame.Rect:
+        x, y = self.origin
+        return DrawableList._compute_rect(self).move(-x, -y)
+
+    def add_multiple(self, iterable_of_objects: Iterable[Drawable]) -> None:
+        objects = [obj for obj in iterable_of_objects if obj not in self]
+        if any(isinstance(obj, Grid) for obj in objects):
+            raise TypeError("A Grid cannot be placed in a DrawableGroup")
+        DrawableList.add_multiple(self, objects)
+        for obj in objects:
+            if obj in self:
+                obj._set_transform_parent(self)
+
+    def remove(self, *obj_list: Drawable) -> None:
+        for obj in obj_list:
+            if obj in self:
+                obj._set_transform_parent(None)
+        DrawableList.remove(self, *obj_list)
+
+    def remove_from_index(self, index: int) -> None:
+        if index in range(len(self)):
+            self.remove(self.list[index])
+
+    def clear(self) -> None:
+        for obj in self.list:
+            obj._set_transform_parent(None)
+        DrawableList.clear(self)
+
+    def move(self, **kwargs) -> None:
+        rect = self.rect
+        new_rect = rect.copy()
+        for attr, value in kwargs.items():
+            setattr(new_rect, attr, value)
+        self.move_ip(new_rect.x - rect.x, new_rect.y - rect.y)
+
+    def move_ip(self, x: float, y: float) -> None:
+        if x or y:
+            self.__position = (self.__position[0] + x, self.__position[1] + y)
+            self._notify_parents()
+            for listener in self.__listeners:
+                listener._child_changed()
+
 class AbstractDrawableListAligned(DrawableList):
 
     HORIZONTAL = "horizontal"
@@ -192,6 +454,8 @@ class AbstractDrawableListAligned(DrawableList):
             }
         }
         self.__justify = justify_dict[orient][justify]
+        self.__pending_align = False
+        self.__pending_move = None
 
     @property
     def offset(self) -> int:
@@ -199,33 +463,94 @@ class AbstractDrawableListAligned(DrawableList):
 
     @offset.setter
     def offset(self, value: int) -> None:
+        self.__resolve_move()
         self.__offset = max(int(value), 0)
-        self.__align_all_objects()
+        self.__set_pending_align()
 
-    @property
-    def rect(self) -> pygame.Rect:
-        left = min((obj.left for obj in self.list), default=0)
-        top = min((obj.top for obj in self.list), default=0)
+    def _compute_rect(self) -> pygame.Rect:
+        rects = [obj.rect for obj in self.list]
+        left = min((rect.left for rect in rects), default=0)
+        top = min((rect.top for rect in rects), default=0)
         size = {"width": 0, "height": 0}
         size_sum = {self.HORIZONTAL: "width", self.VERTICAL: "height"}[self.__orient]
         size_max = {self.HORIZONTAL: "height", self.VERTICAL: "width"}[self.__orient]
-        size[size_sum] = sum(getattr(obj, size_sum) for obj in self.list) + (self.offset * (len(self.list) - 1))
-        size[size_max] = max(getattr(obj, size_max) for obj in self.list)
+        size[size_sum] = sum(getattr(rect, size_sum) for rect in rects) + (self.offset * max(len(rects) - 1, 0))
+        size[size_max] = max((getattr(rect, size_max) for rect in rects), default=0)
         return pygame.Rect(left, top, size["width"], size["height"])
 
     def add_multiple(self, iterable_of_objects: Iterable[Drawable]) -> None:
+        self.__resolve_move()
         DrawableList.add_multiple(self, iterable_of_objects)
-        self.__align_all_objects()
+        self.__set_pending_align()
 
     def remove(self, *obj_list: Drawable) -> None:
+        self.__resolve_move()
         DrawableList.remove(self, *(obj_list))
-        self.__align_all_objects()
+        self.__set_pending_align()
 
     def remove_from_index(self, index: int) -> None:
-        DrawableList.remove_from_index(self, index)
-        self.__align_all_objects()
+        if index in range(len(self)):
+            AbstractDrawableListAligned.remove(self, self.list[index])
 
     def move(self, **kwargs) -> None:
+        if self.__pending_align:
+            self._resolve_layout()
+        if self.__pending_move is None:
+            self.__pending_move = kwargs
+        else:
+            self.__pending_move = self.__merge_move(self.__pending_move, kwargs)
+        self._child_changed()
+
+    def _get_children_layout_owner(self):
+        return self
+
+    def _resolve_layout(self) -> None:
+        DrawableList._resolve_layout(self)
+        if self.__pending_align:
+            self.__pending_align = False
+            self._align_layout()
+        elif self.__pending_move is not None:
+            kwargs = self.__pending_move
+            self.__pending_move = None
+            self.__apply_move(**kwargs)
+
+    def _align_layout(self) -> None:
+        self.__align_all_objects()
+
+    def __resolve_move(self) -> None:
+        if self.__pending_move is not None:
+            self._resolve_layout()
+
+    def __set_pending_align(self) -> None:
+        self.__pending_align = True
+        self._child_changed()
+
+    @staticmethod
+    def __merge_move(former: dict[str, Any], kwargs: dict[str, Any]) -> dict[str, Any]:
+        common = {
+            "center": ("centerx", "centery"), "topleft": ("left", "top"), "topright": ("right", "top"),
+            "bottomleft": ("left", "bottom"), "bottomright": ("right", "bottom"), "midtop": ("centerx", "top"),
+            "midbottom": ("centerx", "bottom"), "midleft": ("left", "centery"), "midright": ("right", "centery")
+        }
+        x_keys = ("x", "left", "right", "centerx")
+        y_keys = ("y", "top", "bottom", "centery")
+        def split(move: dict[str, Any]) -> dict[str, Any]:
+            splitted = dict()
+            for key, value in move.items():
+                if key in common:
+                    splitted[common[key][0]], splitted[common[key][1]] = value
+                else:
+                    splitted[key] = value
+            return splitted
+        former = split(former)
+        kwargs = split(kwargs)
+        if any(key in kwargs for key in x_keys):
+            former = {key: value for key, value in former.items() if key not in x_keys}
+        if any(key in kwargs for key in y_keys):
+            former = {key: value for key, value in former.items() if key not in y_keys}
+        return former | kwargs
+
+    def __apply_move(self, **kwargs) -> None:
         if self.list:
             self.__background.set_size(self.size)
             self.__background.move(**kwargs)
@@ -255,6 +580,7 @@ class ButtonListVertical(DrawableListVertical):
     def __init__(self, offset=0, bg_color=None, draw=True, justify="center", make_uniform_size=True):
         DrawableListVertical.__init__(self, offset, bg_color=bg_color, draw=draw, justify=justify)
         self.__make_uniform_size = bool(make_uniform_size)
+        self.__pending_uniform_size = False
 
     def __iter__(self) -> Iterator[Union[Drawable, Focusable]]:
         return DrawableListVertical.__iter__(self)
@@ -284,13 +610,18 @@ class ButtonListVertical(DrawableListVertical):
                     prev.set_obj_on_side(on_bottom=button)
                     button.set_obj_on_side(on_top=prev)
                 button.remove_obj_on_side(Focusable.ON_BOTTOM)
-            if self.__make_uniform_size:
-                size = (
-                    max(button.width for button in self.list),
-                    max(button.height for button in self.list)
-                )
-                for button in self.list:
-                    button.set_size(size)
+            self.__pending_uniform_size = self.__make_uniform_size
+
+    def _align_layout(self) -> None:
+        if self.__pending_uniform_size and len(self.list) > 0:
+            self.__pending_uniform_size = False
+            size = (
+                max(button.width for button in self.list),
+                max(button.height for button in self.list)
+            )
+            for button in self.list:
+                button.set_size(size)
+        DrawableListVertical._align_layout(self)
 
     def set_obj_on_side(self, on_top=None, on_bottom=None, on_left=None, on_right=None) -> None:
         if isinstance(self, Focusable):
@@ -317,6 +648,7 @@ class ButtonListHorizontal(DrawableListHorizontal):
     def __init__(self, offset=0, bg_color=None, draw=True, justify="center", make_uniform_size=True):
         DrawableListHorizontal.__init__(self, offset, bg_color=bg_color, draw=draw, justify=justify)
         self.__make_uniform_size = bool(make_uniform_size)
+        self.__pending_uniform_size = False
 
     def __iter__(self) -> Iterator[Union[Drawable, Focusable]]:
         return DrawableListHorizontal.__iter__(self)
@@ -346,13 +678,18 @@ class ButtonListHorizontal(DrawableListHorizontal):
                     prev.set_obj_on_side(on_right=button)
                     button.set_obj_on_side(on_left=prev)
                 button.remove_obj_on_side(Focusable.ON_RIGHT)
-            if self.__make_uniform_size:
-                size = (
-                    max(button.width for button in self.list),
-                    max(button.height for button in self.list)
-                )
-                for button in self.list:
-                    button.set_size(size)
+            self.__pending_uniform_size = self.__make_uniform_size
+
+    def _align_layout(self) -> None:
+        if self.__pending_uniform_size and len(self.list) > 0:
+            self.__pending_uniform_size = False
+            size = (
+                max(button.width for button in self.list),
+                max(button.height for button in self.list)
+            )
+            for button in self.list:
+                button.set_size(size)
+        DrawableListHorizontal._align_layout(self)
 
     def set_obj_on_side(self, on_top=None, on_bottom=None, on_left=None, on_right=None) -> None:
         if isinstance(self, Focusable):
@@ -373,3 +710,130 @@ class ButtonListHorizontal(DrawableListHorizontal):
                 self.list[-1].remove_obj_on_side(Focusable.ON_RIGHT)
             for obj in self.list:
                 obj.remove_obj_on_side(*filter(lambda side: side in (Focusable.ON_TOP, Focusable.ON_BOTTOM), sides))
+
+class ScrollingListVertical(DrawableListVertical):
+
+    def __init__(self, create_row: Callable[[], Drawable], update_row: Callable[[Drawable, Any], None], nb_rows: int,
+                 offset=0, bg_color=None, draw=True, justify="center"):
+        DrawableListVertical.__init__(self, offset, bg_color=bg_color, draw=draw, justify=justify)
+        self.__create_row = create_row
+        self.__update_row = update_row
+        self.__nb_rows = max(int(nb_rows), 1)
+        self.__items = tuple()
+        self.__first = 0
+        self.__spare_rows = list()
+        self.__position = None
+
+    @property
+    def items(self) -> Sequence[Any]:
+        return self.__items
+
+    @items.setter
+    def items(self, items: Sequence[Any]) -> None:
+        self.__items = items
+        self.__first = min(self.__first, self.__get_last_first())
+        self.__refresh()
+
+    @property
+    def nb_rows(self) -> int:
+        return self.__nb_rows
+
+    @property
+    def first_visible(self) -> int:
+        return self.__first
+
+    def get_item_index(self, row: Drawable) -> int:
+        return self.__first + self.list.index(row)
+
+    def scroll(self, nb_items: int) -> None:
+        self.scroll_to(self.__first + int(nb_items))
+
+    def scroll_to(self, index: int) -> None:
+        index = min(max(int(index), 0), self.__get_last_first())
+        if index != self.__first:
+            former_first = self.__first
+            self.__first = index
+            self.__refresh(index - former_first)
+
+    def see(self, index: int) -> None:
+        if index < self.__first:
+            self.scroll_to(index)
+        elif index >= self.__first + self.__nb_rows:
+            self.scroll_to(index - self.__nb_rows + 1)
+
+    def __get_last_first(self) -> int:
+        return max(len(self.__items) - self.__nb_rows, 0)
+
+    def __refresh(self, shift=0) -> None:
+        nb_visible = min(self.__nb_rows, len(self.__items) - self.__first)
+        position = self.__position or {"topleft": self.topleft}
+        rows = list(self.list)
+        to_update = range(nb_visible)
+        if len(rows) == nb_visible and 0 < abs(shift) < nb_visible:
+            rows = rows[shift:] + rows[:shift]
+            to_update = range(nb_visible - shift, nb_visible) if shift > 0 else range(-shift)
+        while len(rows) < nb_visible:
+            rows.append(self.__show_row(self.__spare_rows.pop()) if self.__spare_rows else self.__create_row())
+        self.__spare_rows.extend(self.__hide_row(row) for row in rows[nb_visible:])
+        del rows[nb_visible:]
+        if rows != self.list:
+            DrawableList.clear(self)
+            DrawableList.add_multiple(self, rows)
+            self.__link_rows()
+        for index in to_update:
+            self.__update_row(rows[index], self.__items[self.__first + index])
+        if rows:
+            DrawableListVertical.move(self, **position)
+
+    @staticmethod
+    def __show_row(row: Drawable) -> Drawable:
+        from .clickable import Clickable
+        row.show()
+        if isinstance(row, Clickable):
+            row.master.input_router.register(row)
+        return row
+
+    @staticmethod
+    def __hide_row(row: Drawable) -> Drawable:
+        from .clickable import Clickable
+        row.hide()
+        if isinstance(row, Clickable):
+            row.hover = row.active = False
+            row.master.input_router.unregister(row)
+        return row
+
+    def __link_rows(self) -> None:
+        rows = [row for row in self.list if isinstance(row, Focusable)]
+        for row in self.__spare_rows:
+            if isinstance(row, Focusable):
+                row.remove_obj_on_side(Focusable.ON_TOP, Focusable.ON_BOTTOM)
+        for i, row in enumerate(rows):
+            if i > 0:
+                row.set_obj_on_side(on_top=rows[i - 1])
+                rows[i - 1].set_obj_on_side(on_bottom=row)
+        if rows:
+            rows[0].remove_obj_on_side(Focusable.ON_TOP)
+            rows[-1].remove_obj_on_side(Focusable.ON_BOTTOM)
+
+    def _scroll_focus(self, obj: Focusable, side: str) -> bool:
+        if not self.list or obj not in self:
+            return False
+        if side == Focusable.ON_TOP and obj is self.list[0] and self.__first > 0:
+            self.scroll(-1)
+            self.list[0].focus_set()
+            return True
+        if side == Focusable.ON_BOTTOM and obj is self.list[-1] and self.__first < self.__get_last_first():
+            self.scroll(1)
+            self.list[-1].focus_set()
+            return True
+        return False
+
+    def _scroll_wheel(self, mouse_pos: tuple[int, int], wheel: int) -> bool:
+        if not self.rect.collidepoint(mouse_pos):
+            return False
+        self.scroll(-wheel)
+        return True
+
+    def move(self, **kwargs) -> None:
+        self.__position = kwargs
+        DrawableListVertical.move(self, **kwargs)
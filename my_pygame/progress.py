@@ -1,5 +1,6 @@
 # -*- coding: Utf-8 -*
 
+from typing import Optional
 import pygame
 from .text import Text
 from .shape import RectangleShape
@@ -35,6 +36,9 @@ class ProgressBar(RectangleShape):
         self.hide_label()
         self.hide_value()
 
+    def _draw_area(self, rect: pygame.Rect) -> Optional[pygame.Rect]:
+        return None
+
     def _before_drawing(self, surface: pygame.Surface) -> None:
         RectangleShape._before_drawing(self, surface)
         self.__scale_rect.set_size(self.width * self.percent, self.height, smooth=False)
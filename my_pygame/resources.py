@@ -48,13 +48,16 @@ class ResourcesCompiler:
     # __SOUND_EXT = [".ogg", ".wav"]
     __COMPILED_IMG_EXT = ".surface"
     # __COMPILED_SOUND_EXT = ".surface"
+    __ATLAS_FILENAME = "atlas"
+    __ATLAS_WIDTH = 2048
+    __ATLAS_MAX_IMAGE_SIZE = 256
 
     @staticmethod
     def get_compiled_img_extension() -> str:
         return ResourcesCompiler.__COMPILED_IMG_EXT
 
     @staticmethod
-    def compile(path: str, *, delete=False) -> None:
+    def compile(path: str, *, delete=False, atlas=False) -> None:
         #pylint: disable=unused-variable
         path = str(path)
         print()
@@ -62,8 +65,11 @@ class ResourcesCompiler:
             ResourcesCompiler.__compile_file(path, delete)
         elif os.path.isdir(path):
             for root, folders, files in os.walk(path):
+                files = [os.path.join(root, file) for file in files]
+                if atlas:
+                    files = ResourcesCompiler.__compile_atlas(root, files, delete)
                 for file in files:
-                    ResourcesCompiler.__compile_file(os.path.join(root, file), delete)
+                    ResourcesCompiler.__compile_file(file, delete)
 
     @staticmethod
     def __compile_file(path: str, delete: bool) -> None:
@@ -72,16 +78,61 @@ class ResourcesCompiler:
             compiled_img_path = str(path_without_extension + ResourcesCompiler.__COMPILED_IMG_EXT)
             print("->", path.replace("\\", "/"), "compiled to", compiled_img_path.replace("\\", "/"))
             surface = pygame.image.load(path)
-            file_format = "RGBA"
-            buffer_dict = {
-                "string": pygame.image.tostring(surface, file_format),
-                "size": surface.get_size(),
-                "format": file_format
-            }
+            ResourcesCompiler.__dump_surface(surface, compiled_img_path)
+            if delete:
+                os.remove(path)
+
+    @staticmethod
+    def __compile_atlas(folder: str, files: list[str], delete: bool) -> list[str]:
+        images = dict()
+        for path in files:
+            if os.path.splitext(path)[1] in ResourcesCompiler.__IMG_EXT:
+                surface = pygame.image.load(path)
+                if max(surface.get_size()) <= ResourcesCompiler.__ATLAS_MAX_IMAGE_SIZE:
+                    images[path] = surface
+        if len(images) < 2:
+            return files
+        atlas_size, rects = ResourcesCompiler.__pack_rects({path: surface.get_size() for path, surface in images.items()})
+        atlas = pygame.Surface(atlas_size, pygame.SRCALPHA)
+        for path, surface in images.items():
+            atlas.blit(surface, rects[path])
+        atlas_path = os.path.join(folder, ResourcesCompiler.__ATLAS_FILENAME + ResourcesCompiler.__COMPILED_IMG_EXT)
+        print("->", len(images), "images packed in", atlas_path.replace("\\", "/"))
+        ResourcesCompiler.__dump_surface(atlas, atlas_path)
+        for path, rect in rects.items():
+            compiled_img_path = os.path.splitext(path)[0] + ResourcesCompiler.__COMPILED_IMG_EXT
             with open(compiled_img_path, "wb") as compiled_file:
-                pickle.dump(buffer_dict, compiled_file)
+                pickle.dump({"atlas": os.path.basename(atlas_path), "rect": tuple(rect)}, compiled_file)
             if delete:
                 os.remove(path)
+        return [path for path in files if path not in images]
+
+    @staticmethod
+    def __pack_rects(sizes: dict[str, tuple[int, int]]) -> tuple[tuple[int, int], dict[str, pygame.Rect]]:
+        rects = dict()
+        x = y = shelf_height = 0
+        for path, (width, height) in sorted(sizes.items(), key=lambda item: item[1][1], reverse=True):
+            if x + width > ResourcesCompiler.__ATLAS_WIDTH:
+                x = 0
+                y += shelf_height
+                shelf_height = 0
+            rects[path] = pygame.Rect((x, y), (width, height))
+            x += width
+            shelf_height = max(shelf_height, height)
+        atlas_width = max(rect.right for rect in rects.values())
+        atlas_height = max(rect.bottom for rect in rects.values())
+        return (atlas_width, atlas_height), rects
+
+    @staticmethod
+    def __dump_surface(surface: pygame.Surface, compiled_img_path: str) -> None:
+        file_format = "RGBA"
+        buffer_dict = {
+            "string": pygame.image.tostring(surface, file_format),
+            "size": surface.get_size(),
+            "format": file_format
+        }
+        with open(compiled_img_path, "wb") as compiled_file:
+            pickle.dump(buffer_dict, compiled_file)
 
 class ResourcesLoader(dict):
 
@@ -126,11 +177,21 @@ class ResourcesLoader(dict):
 class ImageLoader(ResourcesLoader):
     def __init__(self):
         super().__init__(self.__loader_function)
+        self.__atlas = dict()
+
+    def load(self) -> None:
+        super().load()
+        self.__atlas.clear()
 
     def __loader_function(self, resource: str) -> pygame.Surface:
         if resource.endswith(ResourcesCompiler.get_compiled_img_extension()):
             with open(resource, "rb") as compiled_file:
                 buffer_dict = pickle.load(compiled_file)
+            if "atlas" in buffer_dict:
+                atlas = self.__load_atlas(os.path.join(os.path.dirname(resource), buffer_dict["atlas"]))
+                surface = atlas.subsurface(buffer_dict["rect"])
+                surface.lock()
+                return surface
             surface = pygame.image.fromstring(buffer_dict["string"], buffer_dict["size"], buffer_dict["format"])
         else:
             surface = pygame.image.load(resource)
@@ -138,6 +199,15 @@ class ImageLoader(ResourcesLoader):
         surface.lock()
         return surface
 
+    def __load_atlas(self, atlas_path: str) -> pygame.Surface:
+        atlas = self.__atlas.get(atlas_path)
+        if atlas is None:
+            with open(atlas_path, "rb") as compiled_file:
+                buffer_dict = pickle.load(compiled_file)
+            atlas = pygame.image.fromstring(buffer_dict["string"], buffer_dict["size"], buffer_dict["format"]).convert_alpha()
+            self.__atlas[atlas_path] = atlas
+        return atlas
+
 class FontLoader(ResourcesLoader):
     def __init__(self):
         super().__init__(None)
@@ -216,5 +286,6 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("path", help="Resource file or directory")
     parser.add_argument("--delete", help="Delete the files after compiling", action="store_true")
+    parser.add_argument("--atlas", help="Pack the small images of each folder in a single atlas", action="store_true")
     args = parser.parse_args()
-    ResourcesCompiler.compile(args.path, delete=args.delete)
+    ResourcesCompiler.compile(args.path, delete=args.delete, atlas=args.atlas)
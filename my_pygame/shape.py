@@ -1,18 +1,23 @@
 # -*- coding: Utf-8 -*
 
-from typing import Union, Callable
+from typing import Union, Callable, Optional, Any
 import pygame
 from pygame.math import Vector2
 from .drawable import Drawable
 from .colors import TRANSPARENT, BLACK
 from .surface import create_surface
-from .gradients import horizontal, vertical, radial, squared
+from .gradients import horizontal, vertical, radial, squared, linear
 
 class Shape(Drawable, use_parent_theme=False):
 
+    __slots__ = ("__color", "__outline", "__outline_color", "__images")
+
+    __IMAGE_CACHE_SIZE = 6
+
     def __init__(self, color: pygame.Color, outline: int, outline_color: pygame.Color, theme=None):
         # pylint: disable=unused-argument
         Drawable.__init__(self)
+        self.__images = dict()
         self.color = color
         self.outline = outline
         self.outline_color = outline_color
@@ -60,8 +65,29 @@ class Shape(Drawable, use_parent_theme=False):
     def shape_update(self) -> None:
         pass
 
+    def _use_shape_image(self, key: tuple[Any, ...], draw: Callable[[pygame.Surface], None]) -> None:
+        size = self.size
+        images = self.__images
+        if images and next(iter(images))[0] != size:
+            images.clear()
+        key = (size, *key)
+        surface = images.pop(key, None)
+        if surface is None:
+            surface = create_surface(size)
+            draw(surface)
+            if len(images) >= Shape.__IMAGE_CACHE_SIZE:
+                images.pop(next(iter(images)))
+        images[key] = surface
+        self._use_image(surface)
+
+    def _draw_signature(self) -> Optional[tuple[Any, ...]]:
+        signature = super()._draw_signature()
+        return None if signature is None else (*signature, self.__outline, self.__outline_color)
+
 class PolygonShape(Shape):
 
+    __slots__ = ("__points", "__image_points", "__image_points_percent")
+
     def __init__(self, color: pygame.Color, *, outline=0, outline_color=BLACK, points=list(), theme=None):
         self.__points = list()
         self.__image_points = list()
@@ -120,6 +146,8 @@ class PolygonShape(Shape):
 
 class RectangleShape(Shape):
 
+    __slots__ = ("__draw_params",)
+
     def __init__(self, width: int, height: int, color: pygame.Color, *, outline=0, outline_color=BLACK,
                  border_radius=0, border_top_left_radius=-1, border_top_right_radius=-1,
                  border_bottom_left_radius=-1, border_bottom_right_radius=-1, theme=None):
@@ -134,8 +162,10 @@ class RectangleShape(Shape):
         self.set_size(width, height)
 
     def shape_update(self) -> None:
-        self.image = create_surface(self.size)
-        pygame.draw.rect(self.image, self.color, self.image.get_rect(), **self.__draw_params)
+        self._use_shape_image(
+            (tuple(self.color), *self.__draw_params.values()),
+            lambda surface: pygame.draw.rect(surface, self.color, surface.get_rect(), **self.__draw_params)
+        )
 
     def _after_drawing(self, surface: pygame.Surface) -> None:
         if self.outline > 0:
@@ -171,6 +201,8 @@ class RectangleShape(Shape):
 
 class CircleShape(Shape):
 
+    __slots__ = ("__radius", "__draw_params")
+
     def __init__(self, radius: int, color: pygame.Color, *, outline=0, outline_color=BLACK,
                  draw_top_left=True, draw_top_right=True,
                  draw_bottom_left=True, draw_bottom_right=True, theme=None):
@@ -194,8 +226,10 @@ class CircleShape(Shape):
 
     def shape_update(self) -> None:
         self.__radius = min(self.width // 2, self.height // 2)
-        self.image = create_surface(self.size)
-        pygame.draw.circle(self.image, self.color, (self.radius, self.radius), self.radius, **self.__draw_params)
+        self._use_shape_image(
+            (tuple(self.color), *self.__draw_params.values()),
+            lambda surface: pygame.draw.circle(surface, self.color, (self.radius, self.radius), self.radius, **self.__draw_params)
+        )
 
     def _after_drawing(self, surface: pygame.Surface) -> None:
         if self.outline > 0:
@@ -245,28 +279,36 @@ class CrossShape(Shape):
 
     def shape_update(self) -> None:
         try:
-            self.image = create_surface(self.size)
-            self.image.fill(self.color)
-            image_rect = self.image.get_rect()
-            pygame.draw.line(self.image, self.outline_color, image_rect.topleft, image_rect.bottomright, width=self.outline)
-            pygame.draw.line(self.image, self.outline_color, image_rect.topright, image_rect.bottomleft, width=self.outline)
+            surface = create_surface(self.size)
+            surface.fill(self.color)
+            image_rect = surface.get_rect()
+            pygame.draw.line(surface, self.outline_color, image_rect.topleft, image_rect.bottomright, width=self.outline)
+            pygame.draw.line(surface, self.outline_color, image_rect.topright, image_rect.bottomleft, width=self.outline)
+            self._use_image(surface)
         except:
             pass
 
 class GradientShape(Drawable, use_parent_theme=False):
 
+    __slots__ = ("__left_color", "__right_color", "__gradient_type", "__gradient")
+
     TYPE_HORIZONTAL = horizontal
     TYPE_VERTICAL = vertical
     TYPE_RADIAL = radial
     TYPE_SQUARED = squared
+    TYPE_LINEAR = linear
+
+    __gradient_cache = dict()
+    __gradient_cache_bytes = 0
+    __GRADIENT_CACHE_MAX_BYTES = 32 * 1024 * 1024
 
     def __init__(self, left_color: pygame.Color, right_color: pygame.Color, gradient_type: Callable[..., None]):
         Drawable.__init__(self)
-        self.__left_color = TRANSPARENT
-        self.__right_color = TRANSPARENT
+        self.__left_color = pygame.Color(left_color)
+        self.__right_color = pygame.Color(right_color)
         self.__gradient_type = gradient_type
-        self.left_color = left_color
-        self.right_color = right_color
+        self.__gradient = None
+        self._update_gradient()
 
     @property
     def left_color(self) -> pygame.Color:
@@ -275,7 +317,7 @@ class GradientShape(Drawable, use_parent_theme=False):
     @left_color.setter
     def left_color(self, color: pygame.Color) -> None:
         self.__left_color = pygame.Color(color)
-        self.__update_image()
+        self._update_gradient()
 
     @property
     def right_color(self) -> pygame.Color:
@@ -284,30 +326,57 @@ class GradientShape(Drawable, use_parent_theme=False):
     @right_color.setter
     def right_color(self, color: pygame.Color) -> None:
         self.__right_color = pygame.Color(color)
-        self.__update_image()
+        self._update_gradient()
+
+    def _gradient_options(self) -> tuple[Any, ...]:
+        return tuple()
 
-    def __update_image(self) -> None:
+    def _update_gradient(self) -> None:
         if self.w > 0 and self.h > 0:
             start_color = (self.left_color.r, self.left_color.g, self.left_color.b, self.left_color.a)
             end_color = (self.right_color.r, self.right_color.g, self.right_color.b, self.right_color.a)
-            if self.__gradient_type is self.TYPE_RADIAL:
+            if self.__gradient_type is GradientShape.TYPE_RADIAL:
                 size = min(self.width // 2, self.height // 2)
+            elif self.__gradient_type is GradientShape.TYPE_SQUARED:
+                size = min(self.width, self.height)
             else:
                 size = self.size
-            self.image = self.__gradient_type(size, start_color, end_color)
+            key = (self.__gradient_type, size, start_color, end_color, *self._gradient_options())
+            if self.__gradient == (key, self.image.get_size()):
+                return
+            image = GradientShape.__render_gradient(key)
+            self.__gradient = (key, image.get_size())
+            self.image = image
+
+    @staticmethod
+    def __render_gradient(key: tuple) -> pygame.Surface:
+        cache = GradientShape.__gradient_cache
+        surface = cache.pop(key, None)
+        if surface is None:
+            gradient_type, size, start_color, end_color, *options = key
+            surface = gradient_type(size, start_color, end_color, *options)
+            nbytes = surface.get_width() * surface.get_height() * surface.get_bytesize()
+            if nbytes > GradientShape.__GRADIENT_CACHE_MAX_BYTES:
+                return surface
+            while cache and GradientShape.__gradient_cache_bytes + nbytes > GradientShape.__GRADIENT_CACHE_MAX_BYTES:
+                old_surface = cache.pop(next(iter(cache)))
+                GradientShape.__gradient_cache_bytes -= old_surface.get_width() * old_surface.get_height() * old_surface.get_bytesize()
+            GradientShape.__gradient_cache_bytes += nbytes
+        cache[key] = surface
+        return surface
 
     def set_size(self, *size: Union[int, tuple[int, int]], smooth=True) -> None:
         # pylint: disable=unused-argument
         Drawable.set_size(self, *size, smooth=False)
-        self.__update_image()
+        self._update_gradient()
 
     def set_width(self, width: float, smooth=True)-> None:
         Drawable.set_width(self, width, smooth=False)
-        self.__update_image()
+        self._update_gradient()
 
     def set_height(self, height: float, smooth=True) -> None:
         Drawable.set_height(self, height, smooth=False)
-        self.__update_image()
+        self._update_gradient()
 
 class HorizontalGradientShape(GradientShape, use_parent_theme=False):
 
@@ -321,6 +390,27 @@ class VerticalGradientShape(GradientShape, use_parent_theme=False):
         super().__init__(left_color, right_color, GradientShape.TYPE_VERTICAL)
         self.set_size(width, height)
 
+class LinearGradientShape(GradientShape, use_parent_theme=False):
+
+    __slots__ = ("__angle",)
+
+    def __init__(self, width: int, height: int, left_color: pygame.Color, right_color: pygame.Color, angle: float = 0):
+        self.__angle = float(angle) % 360
+        super().__init__(left_color, right_color, GradientShape.TYPE_LINEAR)
+        self.set_size(width, height)
+
+    @property
+    def angle(self) -> float:
+        return self.__angle
+
+    @angle.setter
+    def angle(self, value: float) -> None:
+        self.__angle = float(value) % 360
+        self._update_gradient()
+
+    def _gradient_options(self) -> tuple[Any, ...]:
+        return (self.__angle,)
+
 class SquaredGradientShape(GradientShape, use_parent_theme=False):
 
     def __init__(self, width: int, height: int, left_color: pygame.Color, right_color: pygame.Color):
@@ -329,6 +419,8 @@ class SquaredGradientShape(GradientShape, use_parent_theme=False):
 
 class RadialGradientShape(GradientShape, use_parent_theme=False):
 
+    __slots__ = ("__radius",)
+
     def __init__(self, radius: int, left_color: pygame.Color, right_color: pygame.Color):
         super().__init__(left_color, right_color, GradientShape.TYPE_RADIAL)
         self.__radius = 0
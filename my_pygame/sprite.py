@@ -3,20 +3,26 @@
 # import itertools
 import pygame
 from pygame.math import Vector2
-from typing import Union, Iterable, Optional
+from typing import Union, Iterable, Optional, Any
 from .surface import create_surface
 from .drawable import Drawable
 from .clock import Clock
 
 class Sprite(Drawable, use_parent_theme=False):
 
+    __frames_cache = dict()
+    __frames_cache_bytes = 0
+    __FRAMES_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
     def __init__(self, *images: Union[pygame.Surface, Drawable], **kwargs):
-        self.__list = [Drawable(image, **kwargs) for image in images]
+        self.__sources = tuple(image.image if isinstance(image, Drawable) else image for image in images)
+        self.__resize_kwargs = kwargs
+        self.__angle = 0
+        self.__frames = self.__get_frames(self.__sources, self.__resize_kwargs, self.__angle)
         self.__resize = False
-        Drawable.__init__(self, self.__list[0].image if self.__list else None)
+        Drawable.__init__(self, self.__frames[0] if self.__frames else None)
         self.__resize = True
         self.__sprite_idx = 0
-        self.__nb_sprites = len(self.__list)
         self.__clock = Clock()
         self.__wait_time = 0
         self.__animation = False
@@ -28,20 +34,63 @@ class Sprite(Drawable, use_parent_theme=False):
 
     @classmethod
     def from_spritesheet(cls, img: pygame.Surface, rect_list: list[pygame.Rect], **kwargs) -> None:
-        return cls.from_iterable((img.subsurface(rect).copy() for rect in rect_list), **kwargs)
+        return cls.from_iterable((img.subsurface(rect) for rect in rect_list), **kwargs)
+
+    @staticmethod
+    def __get_frames(sources: tuple[pygame.Surface, ...], resize_kwargs: dict[str, Any], angle: float) -> tuple[pygame.Surface, ...]:
+        try:
+            key = (sources, tuple(sorted(resize_kwargs.items())), angle)
+            frames = Sprite.__frames_cache.pop(key, None)
+        except TypeError:
+            key = frames = None
+        if frames is None:
+            frames = list()
+            for source in sources:
+                drawable = Drawable(source)
+                drawable.resize(**resize_kwargs)
+                if angle:
+                    drawable.set_rotation(angle)
+                frames.append(drawable.image)
+            frames = tuple(frames)
+            if key is None:
+                return frames
+            nbytes = Sprite.__get_nbytes(frames)
+            if nbytes > Sprite.__FRAMES_CACHE_MAX_BYTES:
+                return frames
+            while Sprite.__frames_cache and Sprite.__frames_cache_bytes + nbytes > Sprite.__FRAMES_CACHE_MAX_BYTES:
+                Sprite.__frames_cache_bytes -= Sprite.__get_nbytes(Sprite.__frames_cache.pop(next(iter(Sprite.__frames_cache))))
+            Sprite.__frames_cache_bytes += nbytes
+        Sprite.__frames_cache[key] = frames
+        return frames
+
+    @staticmethod
+    def __get_nbytes(frames: tuple[pygame.Surface, ...]) -> int:
+        return sum(frame.get_width() * frame.get_height() * frame.get_bytesize() for frame in frames)
+
+    def __update_frames(self) -> None:
+        self.__frames = self.__get_frames(self.__sources, self.__resize_kwargs, self.__angle)
+
+    def _use_frames_of(self, sprite) -> None:
+        self.__sources = sprite.__sources
+        self.__resize_kwargs = sprite.__resize_kwargs
+        self.__angle = sprite.__angle
+        self.__frames = sprite.__frames
+        self.__sprite_idx = 0
+        self.image = self.__frames[0] if self.__frames else None
 
     def get_sprite_list(self) -> list[Drawable]:
-        return self.__list.copy()
+        return [Drawable(frame) for frame in self.__frames]
 
     def resize(self, **kwargs) -> None:
         if self.__resize:
-            for drawable in self.__list:
-                drawable.resize(**kwargs)
+            self.__resize_kwargs = kwargs
+            self.__update_frames()
         super().resize(**kwargs)
 
     def set_rotation(self, angle: float, point: Optional[Union[tuple[int, int], Vector2, str]]=None) -> None:
-        for drawable in self.__list:
-            drawable.set_rotation(angle, point)
+        if self.__resize:
+            self.__angle = angle % 360
+            self.__update_frames()
         super().set_rotation(angle, point)
 
     @property
@@ -53,12 +102,15 @@ class Sprite(Drawable, use_parent_theme=False):
         self.__wait_time = float(value)
 
     def animated_layers(self) -> bool:
-        return bool(self.__animation and self.__nb_sprites > 0)
+        return bool(self.__animation and self.__frames)
+
+    def _draw_area(self, rect: pygame.Rect) -> Optional[pygame.Rect]:
+        return None if self.animated_layers() else rect
 
     def _before_drawing(self, surface: pygame.Surface) -> None:
         if self.animated_layers() and self.__clock.elapsed_time(self.__wait_time):
-            self.__sprite_idx = (self.__sprite_idx + 1) % self.__nb_sprites
-            self.image = self.__list[self.__sprite_idx]
+            self.__sprite_idx = (self.__sprite_idx + 1) % len(self.__frames)
+            self.image = self.__frames[self.__sprite_idx]
             if self.__sprite_idx == 0 and not self.__loop:
                 self.__animation = False
 
@@ -107,7 +159,7 @@ class SpriteDict(Sprite, use_parent_theme=False):
         self.__sprite_name = str(name)
         if self.__sprite_name in self.__sprite_dict:
             former_move = self.get_move()
-            super().__init__(*self.__sprite_dict[self.__sprite_name].get_sprite_list())
+            self._use_frames_of(self.__sprite_dict[self.__sprite_name])
             self.move(**former_move)
         else:
             self.image = create_surface((0, 0))
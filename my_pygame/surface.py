@@ -2,5 +2,76 @@
 
 import pygame
 
+_SURFACE_STATS = {"allocated": 0, "reused": 0, "released": 0, "discarded": 0}
+
+def count_allocation() -> None:
+    _SURFACE_STATS["allocated"] += 1
+
 def create_surface(size: tuple[int, int]) -> pygame.Surface:
+    count_allocation()
     return pygame.Surface(size, flags=pygame.SRCALPHA|pygame.HWSURFACE).convert_alpha()
+
+class SurfacePool:
+
+    __pool = dict()
+    __pool_bytes = 0
+    __max_bytes = 16 * 1024 * 1024
+
+    @staticmethod
+    def acquire(size: tuple[int, int]) -> pygame.Surface:
+        size = (int(size[0]), int(size[1]))
+        surfaces = SurfacePool.__pool.get(size)
+        if not surfaces:
+            return create_surface(size)
+        surface = surfaces.pop()
+        if not surfaces:
+            SurfacePool.__pool.pop(size)
+        SurfacePool.__pool_bytes -= SurfacePool.__get_nbytes(surface)
+        surface.set_clip(None)
+        surface.fill((0, 0, 0, 0))
+        _SURFACE_STATS["reused"] += 1
+        return surface
+
+    @staticmethod
+    def release(surface: pygame.Surface) -> None:
+        nbytes = SurfacePool.__get_nbytes(surface)
+        if surface.get_locked() or surface.get_parent() is not None or not surface.get_flags() & pygame.SRCALPHA \
+        or SurfacePool.__pool_bytes + nbytes > SurfacePool.__max_bytes:
+            _SURFACE_STATS["discarded"] += 1
+            return
+        surfaces = SurfacePool.__pool.setdefault(surface.get_size(), list())
+        if any(obj is surface for obj in surfaces):
+            return
+        surfaces.append(surface)
+        SurfacePool.__pool_bytes += nbytes
+        _SURFACE_STATS["released"] += 1
+
+    @staticmethod
+    def clear() -> None:
+        SurfacePool.__pool.clear()
+        SurfacePool.__pool_bytes = 0
+
+    @staticmethod
+    def set_memory_limit(nbytes: int) -> None:
+        SurfacePool.__max_bytes = max(int(nbytes), 0)
+        while SurfacePool.__pool_bytes > SurfacePool.__max_bytes:
+            size, surfaces = next(iter(SurfacePool.__pool.items()))
+            SurfacePool.__pool_bytes -= SurfacePool.__get_nbytes(surfaces.pop())
+            if not surfaces:
+                SurfacePool.__pool.pop(size)
+
+    @staticmethod
+    def get_memory_usage() -> int:
+        return SurfacePool.__pool_bytes
+
+    @staticmethod
+    def get_stats() -> dict[str, int]:
+        return _SURFACE_STATS.copy()
+
+    @staticmethod
+    def reset_stats() -> None:
+        _SURFACE_STATS.update(allocated=0, reused=0, released=0, discarded=0)
+
+    @staticmethod
+    def __get_nbytes(surface: pygame.Surface) -> int:
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
@@ -4,18 +4,26 @@ import os.path
 import textwrap
 import pygame
 from typing import Union
-from pygame.font import Font, SysFont
-from .surface import create_surface
+from pygame.font import Font
+from .surface import create_surface, SurfacePool
 from .drawable import Drawable
 from .image import Image
 from .colors import BLACK
+from .font_index import SystemFontIndex
 
 class Text(Drawable, use_parent_theme=False):
 
+    __slots__ = ("__color", "__compound", "__custom_font", "__font", "__img", "__justify", "__shadow", "__shadow_color", "__shadow_surface", "__str", "__wrap", "__layout", "__images")
+
     T_LEFT = "left"
     T_RIGHT = "right"
     T_CENTER = "center"
 
+    __font_cache = dict()
+    __render_cache = dict()
+    __RENDER_CACHE_SIZE = 256
+    __IMAGE_CACHE_SIZE = 6
+
     def __init__(self, message=str(), *, font=None, color=BLACK, wrap=0,
                  justify="left", shadow=False, shadow_x=0, shadow_y=0, shadow_color=BLACK,
                  img=None, compound="left", theme=None):
@@ -28,6 +36,8 @@ class Text(Drawable, use_parent_theme=False):
         self.__color = BLACK
         self.__img = None
         self.__compound = self.__justify = "left"
+        self.__layout = None
+        self.__images = dict()
         self.__shadow = (0, 0)
         self.__shadow_surface = Text(message=self.__str, font=self.font, color=BLACK, shadow=False) if shadow else None
         self.__shadow_color = BLACK
@@ -111,22 +121,27 @@ class Text(Drawable, use_parent_theme=False):
 
     @staticmethod
     def create_font_object(font: Union[Font, tuple[str, int, ...], None]) -> Font:
-        obj = None
+        if isinstance(font, Font):
+            return font
         if isinstance(font, (tuple, list)):
-            if font[0] is not None and os.path.isfile(font[0]):
-                obj = Font(*font[0:2])
-                if "bold" in font:
-                    obj.set_bold(True)
-                if "italic" in font:
-                    obj.set_italic(True)
-            else:
-                obj = SysFont(*font[0:2], bold=bool("bold" in font), italic=bool("italic" in font))
-            if "underline" in font:
-                obj.set_underline(True)
-        elif isinstance(font, Font):
-            obj = font
+            key = (font[0], font[1], "bold" in font, "italic" in font, "underline" in font)
         else:
-            obj = SysFont(pygame.font.get_default_font(), 15)
+            key = (pygame.font.get_default_font(), 15, False, False, False)
+        obj = Text.__font_cache.get(key)
+        if obj is None:
+            obj = Text.__font_cache[key] = Text.__load_font(*key)
+        return obj
+
+    @staticmethod
+    def __load_font(name: str, size: int, bold: bool, italic: bool, underline: bool) -> Font:
+        if name is not None and os.path.isfile(name):
+            filepath = name
+        else:
+            filepath, bold, italic = SystemFontIndex.find(name, bold, italic) if name else (None, bold, italic)
+        obj = Font(filepath, size)
+        obj.set_bold(bold)
+        obj.set_italic(italic)
+        obj.set_underline(underline)
         return obj
 
     def config(self, **kwargs) -> None:
@@ -157,6 +172,11 @@ class Text(Drawable, use_parent_theme=False):
         if self.__shadow_surface:
             self.__shadow_surface.config(**config_for_shadow)
 
+    def _draw_area(self, rect: pygame.Rect) -> pygame.Rect:
+        if self.__shadow_surface and self.__shadow_surface.is_shown():
+            return rect.union(rect.move(*self.__shadow[0:2]))
+        return rect
+
     def _before_drawing(self, surface: pygame.Surface) -> None:
         if self.__shadow_surface and self.__shadow_surface.is_shown():
             self.__shadow_surface.move(x=self.x + self.shadow[0], y=self.y + self.shadow[1])
@@ -170,18 +190,53 @@ class Text(Drawable, use_parent_theme=False):
         self.__custom_font.pop(index, None)
         self.__update_surface()
 
+    @staticmethod
+    def __font_state(font: Font) -> tuple[Font, bool, bool, bool]:
+        return (font, font.get_bold(), font.get_italic(), font.get_underline())
+
+    @staticmethod
+    def __render_line(font: Font, line: str, color: pygame.Color) -> pygame.Surface:
+        key = (Text.__font_state(font), line, tuple(color))
+        render = Text.__render_cache.pop(key, None)
+        if render is None:
+            render = font.render(line, True, color)
+            if len(Text.__render_cache) >= Text.__RENDER_CACHE_SIZE:
+                Text.__render_cache.pop(next(iter(Text.__render_cache)))
+        Text.__render_cache[key] = render
+        return render
+
     def __update_surface(self) -> None:
+        layout = (
+            self.__str, self.__font_state(self.__font),
+            tuple((index, self.__font_state(font)) for index, font in self.__custom_font.items()), tuple(self.__color),
+            self.__justify, self.__img, self.__img.image if isinstance(self.__img, Image) else None, self.__compound
+        )
+        if layout == self.__layout:
+            return
+        self.__layout = layout
+        image = self.__images.pop(layout, None)
+        if image is None:
+            self.__render_surface()
+            image = self.image
+            if len(self.__images) >= Text.__IMAGE_CACHE_SIZE:
+                self.__images.pop(next(iter(self.__images)))
+        else:
+            self._use_image(image)
+        self.__images[layout] = image
+
+    def __render_surface(self) -> None:
         render_lines = list()
         size = [0, 0]
         for index, line in enumerate(self.message.splitlines()):
             font = self.__custom_font.get(index, self.font)
-            render = font.render(line, True, self.color)
+            render = self.__render_line(font, line, self.color)
             size[0] = max(size[0], render.get_width())
             size[1] += render.get_height()
             render_lines.append(render)
-        if render_lines:
-            text = create_surface(size)
-            text.fill((0, 0, 0, 0))
+        if len(render_lines) == 1:
+            text = render_lines[0]
+        elif render_lines:
+            text = SurfacePool.acquire(size) if isinstance(self.img, Image) else create_surface(size)
             text_rect = text.get_rect()
             y = 0
             justify_parameters = {
@@ -196,7 +251,10 @@ class Text(Drawable, use_parent_theme=False):
         else:
             text = create_surface((0, 0))
         if not isinstance(self.img, Image):
-            self.image = text
+            if len(render_lines) > 1:
+                self._use_image(text)
+            else:
+                self.image = text
             return
         function_to_get_size = {
             "left": {"width": sum, "height": max},
@@ -229,4 +287,6 @@ class Text(Drawable, use_parent_theme=False):
         self.img.move(**move_img[self.compound])
         self.img.draw(surface_to_draw)
         surface_to_draw.blit(text, text.get_rect(**move_text[self.compound]))
-        self.image = surface_to_draw
+        self._use_image(surface_to_draw)
+        if len(render_lines) > 1:
+            SurfacePool.release(text)
@@ -36,21 +36,27 @@ _DEFAULT_THEME = dict()
 _HIDDEN_DEFAULT_THEME = dict()
 _CLASSES_NOT_USING_PARENT_THEMES = list()
 _CLASSES_NOT_USING_PARENT_DEFAULT_THEMES = list()
+_RESOLVED_THEMES = dict()
 
 class MetaThemedObject(type):
 
     def __call__(cls, *args, **kwargs):
-        default_theme = list()
-        if cls not in _CLASSES_NOT_USING_PARENT_DEFAULT_THEMES:
-            for parent in get_all_parent_class(cls, do_not_search_for=_CLASSES_NOT_USING_PARENT_DEFAULT_THEMES):
-                default_theme += _DEFAULT_THEME.get(parent, list()) + _HIDDEN_DEFAULT_THEME.get(parent, list())
-        default_theme += _HIDDEN_DEFAULT_THEME.get(cls, list()) + _DEFAULT_THEME.get(cls, list())
         theme = kwargs.pop("theme", None)
         if theme is None:
-            theme = list()
+            theme = tuple()
         elif isinstance(theme, str):
-            theme = [theme]
-        theme_kwargs = cls.get_theme_options(*default_theme, *theme)
+            theme = (theme,)
+        else:
+            theme = tuple(theme)
+        key = (ThemeNamespace.get(), cls, theme)
+        theme_kwargs = _RESOLVED_THEMES.get(key)
+        if theme_kwargs is None:
+            default_theme = list()
+            if cls not in _CLASSES_NOT_USING_PARENT_DEFAULT_THEMES:
+                for parent in get_all_parent_class(cls, do_not_search_for=_CLASSES_NOT_USING_PARENT_DEFAULT_THEMES):
+                    default_theme += _DEFAULT_THEME.get(parent, list()) + _HIDDEN_DEFAULT_THEME.get(parent, list())
+            default_theme += _HIDDEN_DEFAULT_THEME.get(cls, list()) + _DEFAULT_THEME.get(cls, list())
+            theme_kwargs = _RESOLVED_THEMES[key] = cls.get_theme_options(*default_theme, *theme)
         return type.__call__(cls, *args, **(theme_kwargs | kwargs))
 
 class ThemedObject(metaclass=MetaThemedObject):
@@ -62,6 +68,7 @@ class ThemedObject(metaclass=MetaThemedObject):
             use_parent_default_theme = False
         if not use_parent_default_theme:
             _CLASSES_NOT_USING_PARENT_DEFAULT_THEMES.append(cls)
+        _RESOLVED_THEMES.clear()
 
     @classmethod
     def set_theme(cls, name: str, options: dict[str, Any]) -> None:
@@ -78,9 +85,11 @@ class ThemedObject(metaclass=MetaThemedObject):
             theme_dict[name] = options
         else:
             theme_dict[name] |= options
+        _RESOLVED_THEMES.clear()
 
     @classmethod
     def set_default_theme(cls, name: Union[str, Sequence[str], None]) -> None:
+        _RESOLVED_THEMES.clear()
         if name is None:
             _DEFAULT_THEME.pop(cls, None)
         else:
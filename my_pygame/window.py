@@ -4,15 +4,18 @@
 import os
 import sys
 import configparser
+import weakref
 from typing import Callable, Any, Union, Optional, Sequence
 from contextlib import contextmanager
 from functools import wraps
 import pygame
 from .theme import ThemeNamespace
 from .drawable import Drawable, Animation
+from .surface import SurfacePool
 from .focusable import Focusable
 from .text import Text
 from .list import DrawableList
+from .focus_graph import FocusGraph
 from .grid import Grid, GridCell
 from .joystick import JoystickList
 from .keyboard import Keyboard
@@ -64,6 +67,7 @@ class WindowDrawableList(DrawableList):
     def __init__(self):
         super().__init__()
         self.__index = -1
+        self.__focus_graph = None
 
     def remove(self, *obj_list: Drawable) -> None:
         super().remove(*(obj_list))
@@ -102,13 +106,26 @@ class WindowDrawableList(DrawableList):
         actual_obj = self.focus_get()
         if actual_obj is None:
             self.focus_next()
-        else:
+        elif not any(obj_list._scroll_focus(actual_obj, side) for obj_list in self.find_objects(DrawableList)):
             obj = actual_obj.get_obj_on_side(side)
             while obj and not obj.take_focus():
                 obj = obj.get_obj_on_side(side)
+            if not obj and self.__focus_graph is not None:
+                self.__focus_graph.sync(self.find_objects(Focusable))
+                obj = self.__focus_graph.find(actual_obj, side)
             if obj:
                 self.set_focus(obj)
 
+    def set_spatial_focus(self, status: bool) -> None:
+        if status and self.__focus_graph is None:
+            self.__focus_graph = FocusGraph()
+        elif not status and self.__focus_graph is not None:
+            self.__focus_graph.clear()
+            self.__focus_graph = None
+
+    def spatial_focus_enabled(self) -> bool:
+        return self.__focus_graph is not None
+
     def set_focus(self, obj: Focusable) -> None:
         focusable_list = self.__get_all_focusable()
         if obj is not None and obj not in focusable_list:
@@ -143,6 +160,81 @@ class WindowDrawableList(DrawableList):
 class WindowDrawable(Drawable):
     pass
 
+class WindowInputRouter:
+
+    def __init__(self, master):
+        self.__master = master
+        self.__clickables = weakref.WeakSet()
+        self.__hovered = list()
+        self.__active = list()
+
+    def register(self, clickable) -> None:
+        self.__clickables.add(clickable)
+
+    def unregister(self, clickable) -> None:
+        self.__clickables.discard(clickable)
+        self.set_hover(clickable, False)
+        self.set_active(clickable, False)
+
+    def set_hover(self, clickable, status: bool) -> None:
+        if status and clickable not in self.__hovered:
+            self.__hovered.append(clickable)
+        elif not status and clickable in self.__hovered:
+            self.__hovered.remove(clickable)
+
+    def set_active(self, clickable, status: bool) -> None:
+        if status and clickable not in self.__active:
+            self.__active.append(clickable)
+        elif not status and clickable in self.__active:
+            self.__active.remove(clickable)
+
+    def find_clickable(self, mouse_pos: tuple[int, int]):
+        return self.__find_clickable_in(self.__master.objects, mouse_pos)
+
+    def __find_clickable_in(self, obj_list: Sequence[Drawable], mouse_pos: tuple[int, int]):
+        for obj in reversed(obj_list):
+            if isinstance(obj, (DrawableList, Grid)):
+                if not obj.rect.collidepoint(mouse_pos):
+                    continue
+                clickable = self.__find_clickable_in(obj.list if isinstance(obj, DrawableList) else obj.drawable, mouse_pos)
+                if clickable is not None:
+                    return clickable
+            if obj in self.__clickables and obj._mouse_collide(mouse_pos):
+                return obj
+        return None
+
+    def click_down(self, event: pygame.event.Event) -> None:
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            target = self.find_clickable(event.pos) if event.button == 1 and Focusable.actual_mode_is(Focusable.MODE_MOUSE) else None
+            focus = self.__master.objects.focus_get()
+            if focus in self.__clickables and focus is not target and getattr(focus, "is_shown", lambda: True)():
+                focus.focus_leave()
+        else:
+            target = self.__master.objects.focus_get()
+            if target not in self.__clickables:
+                target = None
+        if target is not None:
+            target._handle_click_down(event)
+
+    def click_up(self, event: pygame.event.Event) -> None:
+        for clickable in self.__active.copy():
+            clickable._handle_click_up(event)
+
+    def mouse_position(self, mouse_pos: tuple[int, int]) -> None:
+        if not Focusable.actual_mode_is(Focusable.MODE_MOUSE):
+            return
+        target = self.find_clickable(mouse_pos)
+        for clickable in filter(lambda obj: obj is not target, dict.fromkeys(self.__hovered + self.__active)):
+            clickable._handle_mouse_position(mouse_pos, False)
+        if target is not None:
+            target._handle_mouse_position(mouse_pos, True)
+
+    def mouse_wheel(self, event: pygame.event.Event) -> None:
+        mouse_pos = self.__master.map_cursor_position(pygame.mouse.get_pos())
+        for obj_list in reversed(self.__master.objects.find_objects(DrawableList)):
+            if obj_list._scroll_wheel(mouse_pos, event.y):
+                break
+
 class WindowTransition:
 
     def hide_actual_looping_window_start_loop(self, window) -> None:
@@ -236,6 +328,7 @@ class Window(metaclass=MetaWindow):
         self.__joystick_handler_dict = dict()
         self.__joystick_state_dict = dict()
         self.__mouse_handler_list = list()
+        self.__input_router = WindowInputRouter(self)
         self.__callback_after = WindowCallbackList()
         self.bg_color = bg_color
         self.bg_music = bg_music
@@ -248,6 +341,10 @@ class Window(metaclass=MetaWindow):
             pygame.JOYHATMOTION
         )
         self.bind_multiple_event(focus_event, self.__handle_focus)
+        self.bind_multiple_event((pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.JOYBUTTONDOWN), self.__input_router.click_down)
+        self.bind_multiple_event((pygame.KEYUP, pygame.MOUSEBUTTONUP, pygame.JOYBUTTONUP), self.__input_router.click_up)
+        self.bind_mouse(self.__input_router.mouse_position)
+        self.bind_event(pygame.MOUSEWHEEL, self.__input_router.mouse_wheel)
         self.bind_event(pygame.KEYDOWN, self.__key_handler)
         self.bind_multiple_event([pygame.JOYBUTTONDOWN, pygame.JOYAXISMOTION, pygame.JOYHATMOTION], self.__joystick_handler)
         self.__key_enabled = True
@@ -277,6 +374,10 @@ class Window(metaclass=MetaWindow):
     def objects(self) -> WindowDrawableList:
         return self.__objects
 
+    @property
+    def input_router(self) -> WindowInputRouter:
+        return self.__input_router
+
     def __setattr__(self, name, obj) -> None:
         automatic_add = getattr(self, "_Window__automatic_add_drawable_to_object_list", True)
         if name != "_Window__objects" and hasattr(self, "_Window__objects") and automatic_add:
@@ -309,6 +410,15 @@ class Window(metaclass=MetaWindow):
     def disable_key_joy_focus(self) -> None:
         self.__key_enabled = False
 
+    def enable_spatial_focus(self) -> None:
+        self.objects.set_spatial_focus(True)
+
+    def disable_spatial_focus(self) -> None:
+        self.objects.set_spatial_focus(False)
+
+    def spatial_focus_enabled(self) -> bool:
+        return self.objects.spatial_focus_enabled()
+
     @staticmethod
     def enable_key_joy_focus_for_all_window() -> None:
         Window.__all_window_key_enabled = True
@@ -440,6 +550,8 @@ class Window(metaclass=MetaWindow):
         if isinstance(self.__master, Window):
             self.__master.draw_screen(show_fps=False)
         else:
+            Drawable.reset_draw_stats()
+            SurfacePool.reset_stats()
             self.surface.fill(self.bg_color)
         self.objects.draw(self.surface)
         if Window.__show_fps is True and show_fps and self.__show_fps_in_this_window:
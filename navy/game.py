@@ -107,6 +107,7 @@ class Navy(Grid):
             (i, j): NavyGridBox(master, navy=self, size=BOX_SIZE, pos=(i, j))
             for i in range(NB_LINES_BOXES) for j in range(NB_COLUMNS_BOXES)
         })
+        self.set_layer_cache(True)
         self.ships_list = DrawableList()
         self.box_hit_img = DrawableList()
 
@@ -141,7 +142,10 @@ class Navy(Grid):
         self.move()
 
     def get_box(self, line: int, column: int) -> NavyGridBox:
-        return {box.pos: box for box in self.boxes}.get((line, column))
+        return self.get_obj_in_cell(line, column)
+
+    def get_boxes(self, boxes_pos: Sequence[tuple[int, int]]) -> list[NavyGridBox]:
+        return [box for box in map(lambda pos: self.get_box(*pos), sorted(boxes_pos)) if box is not None]
 
     def set_box_clickable(self, click: bool) -> None:
         for box in self.boxes:
@@ -167,7 +171,7 @@ class Navy(Grid):
     def move(self, **kwargs):
         Grid.move(self, **kwargs)
         for ship in self.ships:
-            ship.place_ship(list(filter(lambda box: box.pos in ship.boxes_pos, self.boxes)))
+            ship.place_ship(self.get_boxes(ship.boxes_pos))
 
     def box_hit(self, box: NavyGridBox) -> bool:
         pass
@@ -240,7 +244,7 @@ class OppositeNavy(Navy):
 
     def ai_box_hit(self, box: NavyGridBox) -> bool:
         for ship_infos in self.ai_setup.copy():
-            boxes_covered = list(filter(lambda box: box.pos in ship_infos["boxes"], self.boxes))
+            boxes_covered = self.get_boxes(ship_infos["boxes"])
             if box in boxes_covered:
                 self.set_box_hit(box, True)
                 if all(box.state == Button.DISABLED for box in boxes_covered):
@@ -406,6 +410,7 @@ class FinishWindow(Window):
 class Gameplay(Window):
     def __init__(self):
         Window.__init__(self, bg_color=(0, 200, 255))
+        self.enable_spatial_focus()
         self.player_id = 0
         self.button_back = ImageButton(self, RESOURCES.IMG["arrow_blue"], rotate=180, size=50, callback=self.stop, highlight_color=YELLOW)
         self.player_grid = PlayerNavy(self, self.client_socket)
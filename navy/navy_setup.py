@@ -233,6 +233,7 @@ class WaitEnemy(Window):
 class NavySetup(Window):
     def __init__(self):
         Window.__init__(self, bg_color=(0, 200, 255))
+        self.enable_spatial_focus()
         self.gameplay = Gameplay()
         self.enemy_quit_window = EnemyQuitGame(self)
         self.transition = GameSetupTransition()
@@ -240,12 +241,10 @@ class NavySetup(Window):
         self.start_count_down = lambda: self.count_down.start(at_end=self.timeout) if self.client_socket.connected() else None
         self.button_back = ImageButton(self, RESOURCES.IMG["arrow_blue"], rotate=180, size=50, callback=self.stop)
         self.navy_grid = Grid(self, bg_color=(0, 157, 255))
-        self.__boxes_dict = {
+        self.navy_grid.place_multiple({
             (i, j): BoxSetup(self, size=BOX_SIZE, pos=(i, j))
             for i in range(NB_LINES_BOXES) for j in range(NB_COLUMNS_BOXES)
-        }
-        self.__boxes_list = list(self.__boxes_dict.values())
-        self.navy_grid.place_multiple(self.__boxes_dict)
+        })
         self.ships_list = DrawableListVertical(offset=70, justify="left")
         for ship_name, ship_infos in SHIPS.items():
             ship_line = DrawableListHorizontal(offset=ship_infos["offset"])
@@ -263,7 +262,7 @@ class NavySetup(Window):
 
     @property
     def boxes(self) -> Sequence[BoxSetup]:
-        return self.__boxes_list
+        return self.navy_grid.drawable
 
     def start(self, player_id: int) -> None:
         self.gameplay.player_id = player_id
@@ -334,7 +333,7 @@ class NavySetup(Window):
             ship.clear()
 
     def get_box(self, line: int, column: float) -> BoxSetup:
-        return self.__boxes_dict.get((line, column))
+        return self.navy_grid.get_obj_in_cell(line, column)
 
     def remove_boxes_highlight(self):
         for box in self.boxes:
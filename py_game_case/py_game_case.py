@@ -192,6 +192,7 @@ class PyGameCase(MainWindow):
             HorizontalGradientShape(self.w * 0.5, self.h, left_color, right_color),
             RectangleShape(self.w * 0.25, self.h, right_color),
         )
+        self.bg.set_layer_cache(True)
         self.logo = Image(RESOURCES.IMG["logo"], width=self.bg[0].width)
 
         self.buttons_game_launch = ButtonListVertical(offset=30)
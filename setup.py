@@ -25,7 +25,7 @@ def zip_compress():
         pattern_list.extend(["python*.dll", "vcruntime*.dll"])
     if output_folder != ".":
         for include in options["include_files"]:
-            ResourcesCompiler.compile(os.path.join(output_folder, include), delete=True)
+            ResourcesCompiler.compile(os.path.join(output_folder, include), delete=True, atlas=True)
     for pattern in pattern_list:
         pattern = os.path.join(output_folder, pattern)
         for path in glob.glob(pattern):